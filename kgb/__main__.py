@@ -25,7 +25,8 @@ import absl.logging
 absl.logging.set_verbosity(absl.logging.ERROR)
 
 import atexit
-import json
+import concurrent.futures
+import itertools
 try:
     import readline
 except ImportError:
@@ -33,7 +34,7 @@ except ImportError:
 import shlex
 import sys
 from pathlib import Path
-from typing import Optional, Any
+from typing import Callable, Iterable, Optional, Any
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -44,8 +45,9 @@ from rich.console import Console
 from rich.table import Table
 
 from .clients import ClientConfig, ClientFactory
+from .clients.parsing import loads_json
 from .io.readers import load_records
-from .io.writers import convert_json_directory
+from .io.writers import convert_json_directory, save_triples_json
 from .visualization import batch_render_graphs, TextVisualizer
 from .domains import list_available_domains, ExtractionMode
 from .pipeline import (
@@ -123,6 +125,49 @@ def _build_client_config(
     return ClientConfig(**config_kwargs)
 
 
+def _process_records(
+    records: Iterable[dict[str, Any]],
+    process: Callable[[dict[str, Any]], Any],
+    parallel: int = 1,
+) -> tuple[list[tuple[str, Any]], list[tuple[str, Exception]]]:
+    """Run ``process`` over records, with up to ``parallel`` records in flight.
+
+    LLM calls are network-bound, so a thread pool overlaps their latency.
+    Records are submitted in small windows rather than all at once, so large
+    datasets do not queue one future per record up front. Failures are
+    isolated per record and do not abort the remaining records.
+
+    Returns:
+        Tuple of (successes, failures) as lists of (record_id, result)
+        and (record_id, exception) pairs, in completion order.
+    """
+    successes: list[tuple[str, Any]] = []
+    failures: list[tuple[str, Exception]] = []
+    workers = max(1, parallel)
+    pending_records = iter(records)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        in_flight: dict[concurrent.futures.Future, str] = {}
+
+        def _submit(count: int) -> None:
+            for record in itertools.islice(pending_records, count):
+                in_flight[executor.submit(process, record)] = str(record["id"])
+
+        _submit(2 * workers)
+        while in_flight:
+            done, _ = concurrent.futures.wait(
+                in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                record_id = in_flight.pop(future)
+                try:
+                    successes.append((record_id, future.result()))
+                except Exception as e:
+                    console.print(f"  [red]✗ {record_id}: {e}[/red]")
+                    failures.append((record_id, e))
+            _submit(len(done))
+    return successes, failures
+
+
 # =============================================================================
 # LIST Commands
 # =============================================================================
@@ -193,6 +238,7 @@ def run_pipeline(
     no_progress: bool = typer.Option(False, "--no-progress", help="Hide progress bar"),
     max_workers: Optional[int] = typer.Option(None, "--workers", help="Max parallel workers"),
     timeout: Optional[int] = typer.Option(None, "--timeout", help="Request timeout (seconds)"),
+    cache_dir: Optional[Path] = typer.Option(None, "--cache-dir", help="Cache deterministic (--temp 0) LLM responses in this directory"),
 ):
     """Run a dynamically composed pipeline from a YAML config or logical flags.
 
@@ -206,6 +252,7 @@ def run_pipeline(
     # ----- YAML config-driven mode -------------------------------------------
     if config_file is not None:
         console.print(f"[bold blue]Pipeline Orchestrator Launching (config: {config_file.name})[/bold blue]")
+        runner = None
         try:
             raw_config = load_pipeline_config(config_file)
 
@@ -233,6 +280,8 @@ def run_pipeline(
                 cli_overrides["timeout"] = timeout
             if max_workers is not None:
                 cli_overrides["workers"] = max_workers
+            if cache_dir is not None:
+                cli_overrides["cache_dir"] = cache_dir
             if text_field is not None:
                 cli_overrides["text_field"] = text_field
             if id_field is not None:
@@ -266,6 +315,9 @@ def run_pipeline(
         except Exception as e:
             console.print(f"[bold red]Pipeline Error:[/bold red] {e}")
             raise typer.Exit(code=1)
+        finally:
+            if runner is not None:
+                runner.close()
         return
 
     # ----- Flag-based mode (original behaviour) ------------------------------
@@ -292,6 +344,8 @@ def run_pipeline(
 
     console.print(f"[bold blue]Pipeline Orchestrator Launching[/bold blue]")
 
+    llm_client = None
+    runner = None
     try:
         # Load records and initialize contexts
         records = load_records(input_file, _text_field, _id_field, None, limit)
@@ -303,13 +357,19 @@ def run_pipeline(
         _mode = mode if mode is not None else ExtractionMode.OPEN
         domain_obj = _get_domain(domain, extraction_mode=_mode)
         config = _build_client_config(_client, model, api_key, base_url, _temperature, no_progress, max_workers, _timeout)
+        if cache_dir:
+            config.cache_dir = str(cache_dir)
         llm_client = ClientFactory.create(config)
+        llm_client.warmup()
 
         # Assemble Pipeline Steps Sequence
         steps_sequence = []
 
         if do_extract:
-            steps_sequence.append(get_step("extract")(client=llm_client, domain=domain_obj, temperature=_temperature))
+            steps_sequence.append(get_step("extract")(
+                client=llm_client, domain=domain_obj, temperature=_temperature,
+                cache_dir=str(cache_dir) if cache_dir else None,
+            ))
 
         if do_augment:
             steps_sequence.append(get_step("augment")(client=llm_client, domain=domain_obj, temperature=_temperature))
@@ -351,6 +411,11 @@ def run_pipeline(
     except Exception as e:
         console.print(f"[bold red]Pipeline Error:[/bold red] {e}")
         raise typer.Exit(code=1)
+    finally:
+        if runner is not None:
+            runner.close()
+        if llm_client is not None:
+            llm_client.close()
 
 
 # =============================================================================
@@ -382,6 +447,8 @@ def extract(
     prompt_override: Optional[Path] = typer.Option(None, "--prompt", help="Override extraction prompt", exists=True),
     no_progress: bool = typer.Option(False, "--no-progress", help="Hide progress bar"),
     max_workers: Optional[int] = typer.Option(None, "--workers", help="Max parallel workers"),
+    parallel: int = typer.Option(1, "--parallel", "-p", min=1, help="Number of records to process concurrently"),
+    cache_dir: Optional[Path] = typer.Option(None, "--cache-dir", help="Cache deterministic (--temp 0) LLM responses in this directory"),
     timeout: int = typer.Option(120, "--timeout", help="Request timeout (seconds)"),
 ):
     """Step 1: Extract knowledge graph triples from text.
@@ -389,10 +456,13 @@ def extract(
     \b
     Examples:
         kgb extract --input data.jsonl --domain legal
+        kgb extract --input data.jsonl --domain legal --parallel 8
     """
     console.print(f"[bold blue]Step 1: Extraction[/bold blue]")
     console.print(f"Input: [dim]{input_file}[/dim] | Domain: [green]{domain}[/green]")
     
+    llm_client = None
+    cache = None
     try:
         # Load records
         records = load_records(input_file, text_field, id_field, record_ids, limit)
@@ -403,19 +473,27 @@ def extract(
         domain_obj = get_domain(domain, extraction_mode=mode)
         config = _build_client_config(client, model, api_key, base_url, temperature, no_progress, max_workers, timeout)
         llm_client = ClientFactory.create(config)
+        llm_client.warmup()
         
         # Process
         json_dir = output_dir / "extracted_json"
         json_dir.mkdir(parents=True, exist_ok=True)
         
-        from .builder import extract_triples
-        
-        output_files = {}
-        for record in records:
+        from .builder import extract_triples, prepare_extraction
+        from .clients import LLMCache
+
+        # Prompt and schema state are identical for every record; resolve them once.
+        plan = prepare_extraction(
+            domain_obj,
+            prompt_override.read_text() if prompt_override else None,
+        )
+        cache = LLMCache(cache_dir) if cache_dir else None
+
+        def _extract_record(record: dict[str, Any]) -> Path:
             record_id = str(record["id"])
             text = str(record["text"])
             output_path = json_dir / f"{record_id}.json"
-            
+
             console.print(f"Processing {record_id} (extract only)...")
             triples = extract_triples(
                 client=llm_client,
@@ -423,22 +501,39 @@ def extract(
                 text=text,
                 record_id=record_id,
                 temperature=temperature,
-                prompt_override=prompt_override.read_text() if prompt_override else None
+                plan=plan,
+                cache=cache,
             )
-            
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump([t.model_dump() for t in triples], f, ensure_ascii=False, indent=2)
-            
-            output_files[record_id] = output_path
-            console.print(f"  → {len(triples)} triples saved")
-        
-        console.print(f"\n[bold green]✓ Extraction complete.[/bold green]")
+
+            save_triples_json(triples, output_path)
+
+            console.print(f"  → {record_id}: {len(triples)} triples saved")
+            return output_path
+
+        output_files, failures = _process_records(records, _extract_record, parallel)
+
+        if not failures:
+            console.print(f"\n[bold green]✓ Extraction complete.[/bold green]")
+        elif output_files:
+            console.print(f"\n[bold yellow]⚠ Extraction partially complete: {len(output_files)} of {len(records)} records succeeded.[/bold yellow]")
+        else:
+            console.print(f"\n[bold red]✗ Extraction failed for all {len(records)} records.[/bold red]")
         console.print(f"Output: {json_dir} ({len(output_files)} files)")
-        console.print(f"\n[dim]Next: kgb augment connectivity --input {input_file} --domain {domain}[/dim]")
+        if not failures:
+            console.print(f"\n[dim]Next: kgb augment connectivity --input {input_file} --domain {domain}[/dim]")
         
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
         raise typer.Exit(code=1)
+    finally:
+        if cache is not None:
+            cache.close()
+        if llm_client is not None:
+            llm_client.close()
+
+    if failures:
+        console.print(f"[bold red]{len(failures)} record(s) failed.[/bold red]")
+        raise typer.Exit(code=1)
 
 
 # =============================================================================
@@ -468,8 +563,11 @@ def augment_connectivity(
     temperature: float = typer.Option(0.0, "--temp", help="Sampling temperature"),
     max_disconnected: int = typer.Option(3, "--max-disconnected", help="Target max disconnected components"),
     max_iterations: int = typer.Option(2, "--max-iterations", help="Max refinement iterations"),
+    local_bridging: bool = typer.Option(False, "--local-bridging", help="Link near-duplicate entities before calling the LLM"),
     no_progress: bool = typer.Option(False, "--no-progress", help="Hide progress bar"),
     max_workers: Optional[int] = typer.Option(None, "--workers", help="Max parallel workers"),
+    parallel: int = typer.Option(1, "--parallel", "-p", min=1, help="Number of records to process concurrently"),
+    cache_dir: Optional[Path] = typer.Option(None, "--cache-dir", help="Cache deterministic (--temp 0) bridging responses (Ollama/LM Studio)"),
     timeout: int = typer.Option(120, "--timeout", help="Request timeout"),
 ):
     """Connectivity augmentation: Reduce disconnected graph components.
@@ -477,35 +575,38 @@ def augment_connectivity(
     \b
     Examples:
         kgb augment connectivity --input data.jsonl --domain legal
+        kgb augment connectivity --input data.jsonl --domain legal --parallel 8
     """
     console.print(f"[bold blue]Step 2: Augmentation (Connectivity)[/bold blue]")
     console.print(f"Target: ≤ {max_disconnected} components | Max iterations: {max_iterations}")
     
+    llm_client = None
     try:
         records = load_records(input_file, text_field, id_field, record_ids, limit)
         
         from .domains import get_domain
         domain_obj = get_domain(domain, extraction_mode=mode)
         config = _build_client_config(client, model, api_key, base_url, temperature, no_progress, max_workers, timeout)
+        if cache_dir:
+            config.cache_dir = str(cache_dir)
         llm_client = ClientFactory.create(config)
+        llm_client.warmup()
         
         json_dir = output_dir / "extracted_json"
         json_dir.mkdir(parents=True, exist_ok=True)
         
         from .builder import augment_triples
         
-        output_files = {}
-        for record in records:
+        def _augment_record(record: dict[str, Any]) -> Path:
             record_id = str(record["id"])
             text = str(record["text"])
             output_path = json_dir / f"{record_id}.json"
-            
+
             existing_triples = None
             if output_path.exists():
                 console.print(f"[dim]Loading existing triples for {record_id}[/dim]")
-                with open(output_path, "r", encoding="utf-8") as f:
-                    existing_triples = json.load(f)
-            
+                existing_triples = loads_json(output_path.read_bytes())
+
             console.print(f"Processing {record_id} (augment connectivity)...")
             triples, metadata = augment_triples(
                 client=llm_client,
@@ -516,24 +617,39 @@ def augment_connectivity(
                 temperature=temperature,
                 max_disconnected=max_disconnected,
                 max_iterations=max_iterations,
-                augmentation_strategy="connectivity"
+                augmentation_strategy="connectivity",
+                local_bridging=local_bridging,
             )
-            
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump([t.model_dump() for t in triples], f, ensure_ascii=False, indent=2)
-            
-            output_files[record_id] = output_path
+
+            save_triples_json(triples, output_path)
+
             if metadata.get("partial_result"):
-                console.print(f"  [yellow]⚠ Partial result saved due to iteration failure.[/yellow]")
-            console.print(f"  → {len(triples)} triples saved (Final components: {metadata['final_components']})")
+                console.print(f"  [yellow]⚠ {record_id}: partial result saved due to iteration failure.[/yellow]")
+            console.print(f"  → {record_id}: {len(triples)} triples saved (Final components: {metadata['final_components']})")
+            return output_path
+
+        output_files, failures = _process_records(records, _augment_record, parallel)
         
-        console.print(f"\n[bold green]✓ Augmentation complete.[/bold green]")
+        if not failures:
+            console.print(f"\n[bold green]✓ Augmentation complete.[/bold green]")
+        elif output_files:
+            console.print(f"\n[bold yellow]⚠ Augmentation partially complete: {len(output_files)} of {len(records)} records succeeded.[/bold yellow]")
+        else:
+            console.print(f"\n[bold red]✗ Augmentation failed for all {len(records)} records.[/bold red]")
         console.print(f"Output: {json_dir} ({len(output_files)} files)")
-        console.print(f"\n[dim]Next: kgb convert --input {json_dir}[/dim]")
+        if not failures:
+            console.print(f"\n[dim]Next: kgb convert --input {json_dir}[/dim]")
         
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
         raise typer.Exit(code=1)
+    finally:
+        if llm_client is not None:
+            llm_client.close()
+
+    if failures:
+        console.print(f"[bold red]{len(failures)} record(s) failed.[/bold red]")
+        raise typer.Exit(code=1)
 
 
 @augment_app.callback(invoke_without_command=True)
@@ -552,19 +668,21 @@ def augment_default(ctx: typer.Context):
 def convert(
     input_dir: Path = typer.Option(..., "--input", "-i", help="Directory with JSON triples", exists=True),
     output_dir: Optional[Path] = typer.Option(None, "--output", "-o", help="Output directory for GraphML"),
+    max_workers: int = typer.Option(1, "--workers", min=1, help="Number of files to convert in parallel"),
 ):
     """Convert JSON triples to GraphML format.
     
     \b
     Examples:
         kgb convert --input outputs/extracted_json
+        kgb convert --input outputs/extracted_json --workers 4
     """
     console.print(f"[bold blue]Converting JSON to GraphML[/bold blue]")
     
     graphml_dir = output_dir or input_dir.parent / "graphml"
     
     try:
-        graphml_files = convert_json_directory(input_dir, graphml_dir)
+        graphml_files = convert_json_directory(input_dir, graphml_dir, max_workers)
         console.print(f"\n[bold green]✓ Converted {len(graphml_files)} files[/bold green]")
         console.print(f"Output: {graphml_dir}")
         console.print(f"\n[dim]Next: kgb visualize network --input {graphml_dir}[/dim]")
@@ -583,6 +701,7 @@ def visualize_network(
     output_dir: Optional[Path] = typer.Option(None, "--output", "-o", help="Output directory for HTML"),
     dark_mode: bool = typer.Option(False, "--dark-mode", help="Enable premium dark mode theme"),
     layout: str = typer.Option("spring", "--layout", help="Graph layout (spring, circular, kamada_kawai, shell)"),
+    max_workers: int = typer.Option(1, "--workers", min=1, help="Number of graphs to render in parallel"),
 ):
     """Create interactive network visualizations from GraphML.
     
@@ -595,7 +714,7 @@ def visualize_network(
     viz_dir = output_dir or input_dir.parent / "visualizations"
     
     try:
-        html_files = batch_render_graphs(input_dir, viz_dir, dark_mode=dark_mode, layout=layout)
+        html_files = batch_render_graphs(input_dir, viz_dir, dark_mode=dark_mode, layout=layout, max_workers=max_workers)
         console.print(f"\n[bold green]✓ Created {len(html_files)} network visualizations[/bold green]")
         console.print(f"Output: {viz_dir}")
     except Exception as e:
@@ -635,8 +754,7 @@ def visualize_extraction(
             text = str(r["text"])
             triple_file = triples_dir / f"{rid}.json"
             if triple_file.exists():
-                with open(triple_file, "r", encoding="utf-8") as f:
-                    triples = json.load(f)
+                triples = loads_json(triple_file.read_bytes())
                 record_map[rid] = (text, triples)
         
         html_files = visualizer.batch_render(record_map, viz_dir, group_by=group_by)
@@ -689,15 +807,15 @@ _COMPLETIONS = [
     "help", "exit", "quit",
     "--input", "--input-file", "--output", "--output-dir",
     "--domain", "--client", "--model", "--mode",
-    "--limit", "--temp", "--workers", "--timeout",
+    "--limit", "--temp", "--workers", "--parallel", "--cache-dir", "--timeout",
     "--no-progress", "--api-key", "--base-url",
     "--text-field", "--id-field", "--record-ids",
     "--prompt", "--dark-mode", "--layout",
     "--extract", "--augment", "--convert", "--visualize",
     "--config", "-f",
-    "--max-disconnected", "--max-iterations",
+    "--max-disconnected", "--max-iterations", "--local-bridging",
     "--triples", "--speed", "--group-by",
-    "-i", "-o", "-d", "-c", "-m", "-l", "-t",
+    "-i", "-o", "-d", "-c", "-m", "-l", "-t", "-p",
 ]
 
 
@@ -9,7 +9,7 @@ Extensibility:
 - Use `list_strategies()` to discover available strategies.
 """
 
-from .extraction import extract_triples
+from .extraction import extract_triples, prepare_extraction, ExtractionPlan
 from .augmentation import (
     augment_triples,
     AugmentationStrategy,
@@ -20,6 +20,8 @@ from .augmentation import (
 
 __all__ = [
     "extract_triples",
+    "prepare_extraction",
+    "ExtractionPlan",
     "augment_triples",
     "AugmentationStrategy",
     "register_strategy",
@@ -8,21 +8,28 @@ This module provides:
 
 from __future__ import annotations
 
+import json
+import logging
+import re
+from difflib import SequenceMatcher
+from itertools import combinations
 from typing import Any, Protocol, Callable
 
-import networkx as nx
-
 from ..clients import BaseLLMClient
+from ..clients.parsing import extract_json_span, loads_json
 from ..domains import KnowledgeDomain, Triple, InferenceType
 from .extraction import extract_triples
 from .validation import (
     build_schema_guidance,
     collect_schema_constraints,
+    normalize_constraint_label,
     render_prompt_template,
     validate_triples_against_schema,
     warn_on_schema_validation,
 )
 
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # Strategy Protocol & Registry
 # =============================================================================
@@ -83,66 +90,159 @@ def list_strategies() -> list[str]:
 # Shared Utilities
 # =============================================================================
 
-def _build_graph_from_triples(triples: list[Triple]) -> nx.DiGraph:
-    """Build NetworkX graph from Triple objects for analysis."""
-    G = nx.DiGraph()
-    for t in triples:
-        if t.head and t.tail:
-            G.add_edge(t.head, t.tail, relation=t.relation)
-    return G
+class _ComponentIndex:
+    """Union-Find over entity names for tracking weak connectivity.
+
+    Connectivity is the only graph property the strategies need, so a
+    disjoint-set with path halving and union by rank replaces building a
+    NetworkX DiGraph and walking it on every iteration.
+    """
+
+    def __init__(self) -> None:
+        self.parent: dict[str, str] = {}
+        self.rank: dict[str, int] = {}
+
+    def find(self, node: str) -> str:
+        """Return the root of a node's set, adding the node if unseen."""
+        parent = self.parent
+        if node not in parent:
+            parent[node] = node
+            self.rank[node] = 0
+            return node
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(self, a: str, b: str) -> None:
+        """Merge the sets containing a and b."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+
+    def add_triples(self, triples: list[Triple]) -> None:
+        """Union the head and tail of each triple into the index."""
+        for t in triples:
+            if t.head and t.tail:
+                self.union(t.head, t.tail)
+
+    def components(self) -> list[set[str]]:
+        """Group nodes by root, in first-seen node order."""
+        groups: dict[str, set[str]] = {}
+        for node in self.parent:
+            groups.setdefault(self.find(node), set()).add(node)
+        return list(groups.values())
+
+
+def _build_components_from_triples(triples: list[Triple]) -> _ComponentIndex:
+    """Build a connectivity index from Triple objects for analysis."""
+    index = _ComponentIndex()
+    index.add_triples(triples)
+    return index
 
 
 # =============================================================================
 # Built-in Connectivity Strategy
 # =============================================================================
 
-def _format_components(components: list[set], G: nx.DiGraph, triples: list) -> str:
+def _format_components(components: list[set], triples: list) -> str:
     """Format disconnected components with their triples for the augmentation prompt.
     
+    Triples are bucketed by component in a single pass, and entity names are
+    sorted so equivalent graphs always render byte-identical prompts.
+    
     Args:
-        components: List of sets of node names (from nx.weakly_connected_components)
-        G: The NetworkX graph
+        components: List of sets of node names (from _ComponentIndex.components)
         triples: List of Triple objects
         
     Returns:
         Formatted string showing each component with its entities and triples
     """
+    component_of = {node: idx for idx, nodes in enumerate(components) for node in nodes}
+    component_triples: list[list[str]] = [[] for _ in components]
+    for t in triples:
+        if isinstance(t, dict):
+            head, relation, tail = t.get('head', ''), t.get('relation', ''), t.get('tail', '')
+        else:
+            head, relation, tail = t.head, t.relation, t.tail
+        idx = component_of.get(head, component_of.get(tail))
+        if idx is not None:
+            component_triples[idx].append(f"  ({head}) --[{relation}]--> ({tail})")
+
     formatted = []
-    
-    for i, nodes in enumerate(components, 1):
-        # Get entities in this component
-        node_list = list(nodes)[:15]  # Limit to 15 entities for readability
-        truncated = len(nodes) > 15
-        
-        # Find triples that belong to this component (both head and tail in this component)
-        component_triples = []
-        for t in triples:
-            head = getattr(t, 'head', t.get('head', '')) if isinstance(t, dict) else t.head
-            tail = getattr(t, 'tail', t.get('tail', '')) if isinstance(t, dict) else t.tail
-            if head in nodes or tail in nodes:
-                relation = getattr(t, 'relation', t.get('relation', '')) if isinstance(t, dict) else t.relation
-                component_triples.append(f"  ({head}) --[{relation}]--> ({tail})")
-        
-        # Format component output
-        entity_str = ", ".join(node_list)
-        if truncated:
+    for i, (nodes, comp_triples) in enumerate(zip(components, component_triples), 1):
+        # Limit to 15 entities for readability
+        entity_str = ", ".join(sorted(nodes)[:15])
+        if len(nodes) > 15:
             entity_str += f"... (+{len(nodes) - 15} more)"
-        
-        comp_output = f"Component {i}:\n"
-        comp_output += f"  Entities: [{entity_str}]\n"
-        comp_output += f"  Triples ({len(component_triples)}):\n"
-        
+
+        lines = [
+            f"Component {i}:",
+            f"  Entities: [{entity_str}]",
+            f"  Triples ({len(comp_triples)}):",
+        ]
         # Limit triples shown per component
-        for triple_str in component_triples[:10]:
-            comp_output += f"    {triple_str}\n"
-        if len(component_triples) > 10:
-            comp_output += f"    ... (+{len(component_triples) - 10} more triples)\n"
-        
-        formatted.append(comp_output)
+        lines.extend(f"    {triple_str}" for triple_str in comp_triples[:10])
+        if len(comp_triples) > 10:
+            lines.append(f"    ... (+{len(comp_triples) - 10} more triples)")
+        formatted.append("\n".join(lines) + "\n")
     
     return "\n".join(formatted)
 
 
+def _normalize_entity_name(name: str) -> str:
+    """Casefold, collapse whitespace and strip a plural 's' for matching."""
+    key = " ".join(name.casefold().split())
+    if len(key) > 3 and key.endswith("s") and not key.endswith("ss"):
+        key = key[:-1]
+    return key
+
+
+def _find_local_bridges(components: list[set[str]], similarity: float = 0.9) -> list[Triple]:
+    """Link components whose entity names are near-duplicates, without an LLM call.
+
+    Names are bucketed by the first three characters of their normalized
+    form, so only plausible pairs are compared. A pair matches on equal
+    normalized names or a difflib ratio of at least ``similarity``. At most
+    one ``same_as`` bridge is emitted per pair of components.
+    """
+    buckets: dict[str, list[tuple[int, str, str]]] = {}
+    for idx, nodes in enumerate(components):
+        for node in sorted(nodes):
+            key = _normalize_entity_name(node)
+            buckets.setdefault(key[:3], []).append((idx, node, key))
+
+    linked: set[tuple[int, int]] = set()
+    bridges: list[Triple] = []
+    for entries in buckets.values():
+        for (ci, a, key_a), (cj, b, key_b) in combinations(entries, 2):
+            pair = (min(ci, cj), max(ci, cj))
+            if ci == cj or pair in linked:
+                continue
+            if key_a != key_b:
+                matcher = SequenceMatcher(None, key_a, key_b)
+                if (
+                    matcher.real_quick_ratio() < similarity
+                    or matcher.quick_ratio() < similarity
+                    or matcher.ratio() < similarity
+                ):
+                    continue
+            linked.add(pair)
+            bridges.append(Triple(
+                head=a,
+                relation="same_as",
+                tail=b,
+                inference=InferenceType.CONTEXTUAL,
+                justification="Near-identical entity names in disconnected components",
+            ))
+    return bridges
+
+
 @register_strategy("connectivity")
 def connectivity_strategy(
     client: BaseLLMClient,
@@ -155,12 +255,16 @@ def connectivity_strategy(
     temperature: float = 0.0,
     max_tokens: int | None = None,
     augmentation_prompt_override: str | None = None,
+    local_bridging: bool = False,
     **kwargs: Any
 ) -> tuple[list[Triple], dict[str, Any]]:
     """Connectivity augmentation: Reduce disconnected graph components.
     
     Iteratively prompts the LLM to find bridging relationships between
     disconnected components until the target is reached or max iterations.
+    With ``local_bridging``, components whose entity names are near-duplicates
+    are first linked with ``same_as`` triples, skipping the LLM call when
+    that alone reaches the target.
     
     Args:
         client: LLM client
@@ -172,6 +276,7 @@ def connectivity_strategy(
         temperature: Sampling temperature
         max_tokens: Max tokens for LLM
         augmentation_prompt_override: Override the default prompt
+        local_bridging: Link near-duplicate entities locally before each LLM call
         
     Returns:
         Tuple of (all_triples, metadata)
@@ -183,17 +288,37 @@ def connectivity_strategy(
     all_triples = list(triples)  # Copy to avoid mutating input
     iterations_data = []
     error_occurred = False
+    # Built once and updated with each iteration's new triples
+    component_index = _build_components_from_triples(all_triples)
+    seen_triples = {(t.head, t.relation, t.tail) for t in all_triples}
+    # same_as bridges would be rejected by a constrained schema without it
+    local_bridging = local_bridging and (
+        not constraints.enforce
+        or normalize_constraint_label("same_as") in constraints.normalized_relation_types
+    )
+    local_bridge_count = 0
 
     for i in range(max_iterations):
         try:
-            G = _build_graph_from_triples(all_triples)
-            components = list(nx.weakly_connected_components(G))
+            components = component_index.components()
+
+            if local_bridging and len(components) > max_disconnected:
+                bridges = [
+                    t for t in _find_local_bridges(components)
+                    if (t.head, t.relation, t.tail) not in seen_triples
+                ]
+                if bridges:
+                    seen_triples.update((t.head, t.relation, t.tail) for t in bridges)
+                    all_triples.extend(bridges)
+                    component_index.add_triples(bridges)
+                    local_bridge_count += len(bridges)
+                    components = component_index.components()
             
             if len(components) <= max_disconnected:
                 break
 
             # Prepare augmentation prompt
-            comp_text = _format_components(components, G, all_triples)
+            comp_text = _format_components(components, all_triples)
             current_triples_dicts = [t.model_dump() for t in all_triples]
             
             record = {
@@ -228,7 +353,7 @@ def connectivity_strategy(
                     new_triples.append(Triple(**t_dict))
                     normalized_new_triples_raw.append(t_dict)
                 except Exception as e:
-                    print(f"Warning: Skipping invalid augmented triple: {e}")
+                    logger.warning("Skipping invalid augmented triple: %s", e)
 
             validated_new_triples, validation_summary = validate_triples_against_schema(
                 new_triples,
@@ -237,7 +362,17 @@ def connectivity_strategy(
             )
             warn_on_schema_validation("augmentation", validation_summary)
 
+            # Drop triples the graph already contains (the LLM often repeats them)
+            unique_new_triples = []
+            for t in validated_new_triples:
+                key = (t.head, t.relation, t.tail)
+                if key not in seen_triples:
+                    seen_triples.add(key)
+                    unique_new_triples.append(t)
+            validated_new_triples = unique_new_triples
+
             all_triples.extend(validated_new_triples)
+            component_index.add_triples(validated_new_triples)
             iterations_data.append({
                 "iteration": i + 1,
                 "components_before": len(components),
@@ -245,9 +380,14 @@ def connectivity_strategy(
                 "status": "success",
                 "schema_validation": validation_summary,
             })
+
+            # At temperature 0 an unchanged graph renders the same prompt and
+            # gets the same answer, so further iterations cannot make progress
+            if not validated_new_triples and not temperature:
+                break
             
         except Exception as e:
-            print(f"Error during augmentation iteration {i+1}: {e}")
+            logger.warning("Error during augmentation iteration %d: %s", i + 1, e)
             iterations_data.append({
                 "iteration": i + 1,
                 "status": "failed",
@@ -256,13 +396,13 @@ def connectivity_strategy(
             error_occurred = True
             break
 
-    final_G = _build_graph_from_triples(all_triples)
-    final_components = list(nx.weakly_connected_components(final_G))
+    final_components = component_index.components()
 
     metadata = {
         "strategy": "connectivity",
         "iterations": iterations_data, 
         "final_components": len(final_components),
+        "local_bridges": local_bridge_count,
         "partial_result": error_occurred,
         "schema_constraints_applied": constraints.enforce,
         "allowed_entity_types": list(constraints.entity_types),
@@ -310,31 +450,31 @@ def _build_entity_context(entities: list[str], triples: list[Triple]) -> dict[st
     return context
 
 
+_FENCE_PATTERN = re.compile(r"```(?:json)?\s*([\s\S]*?)```")
+
+
 def _parse_entity_mapping(response_text: str) -> dict[str, str]:
     """Parse LLM response into a variant→canonical mapping.
 
     The LLM returns a JSON array of {canonical, variants} groups.
     We invert that into a flat lookup: variant_string → canonical_string.
     """
-    import json as _json
-    import re as _re
-
     text = response_text.strip()
 
     # Strip markdown fences
     if text.startswith("```"):
-        match = _re.search(r"```(?:json)?\s*([\s\S]*?)```", text)
+        match = _FENCE_PATTERN.search(text)
         if match:
             text = match.group(1).strip()
 
     # Find JSON array
-    json_match = _re.search(r'\[[\s\S]*\]', text)
-    if not json_match:
+    json_span = extract_json_span(text, "[")
+    if json_span is None:
         return {}
 
     try:
-        groups = _json.loads(json_match.group(0))
-    except _json.JSONDecodeError:
+        groups = loads_json(json_span)
+    except json.JSONDecodeError:
         return {}
 
     mapping: dict[str, str] = {}
@@ -412,8 +552,6 @@ def entity_resolution_strategy(
     Returns:
         Tuple of (resolved_triples, metadata)
     """
-    import json as _json
-
     # 1. Collect unique entities and their context (triples they appear in)
     entities = _collect_unique_entities(triples)
     if len(entities) <= 1:
@@ -540,7 +678,8 @@ def augment_triples(
     max_iterations: int = 2,
     augmentation_strategy: str = "connectivity",
     prompt_override: str | None = None,
-    augmentation_prompt_override: str | None = None
+    augmentation_prompt_override: str | None = None,
+    local_bridging: bool = False,
 ) -> tuple[list[Triple], dict[str, Any]]:
     """Extract triples with iterative improvement via a registered strategy.
 
@@ -562,6 +701,7 @@ def augment_triples(
         augmentation_strategy: Strategy name (default: "connectivity")
         prompt_override: Extraction prompt override
         augmentation_prompt_override: Augmentation prompt override
+        local_bridging: Link near-duplicate entities without the LLM (passed to strategy)
 
     Returns:
         Tuple of (all_triples, metadata)
@@ -585,7 +725,7 @@ def augment_triples(
                     validated_triples.append(triple)
                     raw_validated_triples.append(t)
                 except Exception as e:
-                    print(f"Warning: Skipping invalid initial triple: {e}")
+                    logger.warning("Skipping invalid initial triple: %s", e)
         extraction_constraints = collect_schema_constraints(domain, domain.extraction.examples)
         triples, validation_summary = validate_triples_against_schema(
             validated_triples,
@@ -617,7 +757,8 @@ def augment_triples(
         max_iterations=max_iterations,
         temperature=temperature,
         max_tokens=max_tokens,
-        augmentation_prompt_override=augmentation_prompt_override
+        augmentation_prompt_override=augmentation_prompt_override,
+        local_bridging=local_bridging,
     )
     if initial_schema_validation is not None:
         metadata["initial_schema_validation"] = initial_schema_validation
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
-import langextract as lx
-from ..clients import BaseLLMClient
+from ..clients import BaseLLMClient, LLMCache
 from ..domains import KnowledgeDomain, Triple
 from .validation import (
     SchemaConstraints,
@@ -17,14 +17,43 @@ from .validation import (
     warn_on_schema_validation,
 )
 
+if TYPE_CHECKING:
+    import langextract as lx
 
-def _build_examples(domain: KnowledgeDomain) -> list[lx.data.ExampleData]:
+_PROMPT_DESCRIPTION = (
+    "Extract meaningful knowledge graph triples from the text, "
+    "focusing on explicit relationships between entities."
+)
+
+
+# Converted examples keyed by a digest of their content, shared across domain instances
+_EXAMPLES_CACHE: dict[str, tuple[lx.data.ExampleData, ...]] = {}
+
+
+def _build_examples(raw_examples: list[dict[str, Any]], digest: str) -> list[lx.data.ExampleData]:
     """Build extraction examples from the domain configuration.
 
-    Converts raw example dicts to proper langextract ExampleData objects
-    with Extraction objects (not plain dicts).
+    The converted examples are memoized by the digest of the raw examples,
+    so every domain instance and extraction plan with the same examples
+    shares one set of ExampleData objects, and edited examples never reuse
+    a stale conversion.
     """
-    raw_examples = domain.extraction.examples
+    examples = _EXAMPLES_CACHE.get(digest)
+    if examples is None:
+        examples = tuple(_convert_examples(raw_examples))
+        _EXAMPLES_CACHE[digest] = examples
+    return list(examples)
+
+
+def _convert_examples(raw_examples: list[dict[str, Any]]) -> list[lx.data.ExampleData]:
+    """Convert raw example dicts to langextract ExampleData objects.
+
+    Extractions become proper Extraction objects (not plain dicts).
+    langextract is imported here, on first use, so importing the builder
+    (and with it the CLI and pipeline) does not load it.
+    """
+    import langextract as lx
+
     examples = []
 
     # Valid fields for lx.data.Extraction
@@ -65,6 +94,47 @@ def _build_examples(domain: KnowledgeDomain) -> list[lx.data.ExampleData]:
     return examples
 
 
+@dataclass(frozen=True, slots=True)
+class ExtractionPlan:
+    """Record-independent extraction state for a domain.
+
+    Built once by `prepare_extraction` and reused across records so the
+    schema constraints, prompt guidance and few-shot examples are not
+    recomputed per call.
+    """
+
+    prompt_template: str
+    constraints: SchemaConstraints
+    schema_guidance: str
+    examples: list[lx.data.ExampleData]
+    examples_digest: str
+
+
+def prepare_extraction(
+    domain: KnowledgeDomain,
+    prompt_override: str | None = None,
+) -> ExtractionPlan:
+    """Resolve the prompt template and schema constraints for a domain.
+
+    Args:
+        domain: Knowledge domain providing prompts and examples
+        prompt_override: Optional prompt template override
+
+    Returns:
+        ExtractionPlan to pass to `extract_triples`
+    """
+    raw_examples = domain.extraction.examples
+    constraints = collect_schema_constraints(domain, raw_examples)
+    examples_digest = LLMCache.make_key(examples=raw_examples)
+    return ExtractionPlan(
+        prompt_template=prompt_override or domain.extraction.prompt,
+        constraints=constraints,
+        schema_guidance=build_schema_guidance(constraints),
+        examples=_build_examples(raw_examples, examples_digest),
+        examples_digest=examples_digest,
+    )
+
+
 def extract_triples(
     client: BaseLLMClient,
     domain: KnowledgeDomain,
@@ -72,7 +142,9 @@ def extract_triples(
     record_id: str | None = None,
     temperature: float = 0.0,
     max_tokens: int | None = None,
-    prompt_override: str | None = None
+    prompt_override: str | None = None,
+    plan: ExtractionPlan | None = None,
+    cache: LLMCache | None = None,
 ) -> list[Triple]:
     """Extract triples from a single text.
 
@@ -83,7 +155,9 @@ def extract_triples(
         record_id: Optional record ID for logging
         temperature: Sampling temperature
         max_tokens: Max tokens to generate
-        prompt_override: Optional prompt template override
+        prompt_override: Optional prompt template override (ignored if plan is given)
+        plan: Precomputed plan from `prepare_extraction`; built on the fly if omitted
+        cache: Optional response cache, consulted only when temperature is 0
 
     Returns:
         List of extracted Triple objects
@@ -92,26 +166,47 @@ def extract_triples(
     if record_id:
         record["id"] = record_id
 
-    prompt_template = prompt_override or domain.extraction.prompt
-    raw_examples = domain.extraction.examples
-    constraints = collect_schema_constraints(domain, raw_examples)
+    if plan is None:
+        plan = prepare_extraction(domain, prompt_override)
+    constraints = plan.constraints
     final_prompt = render_prompt_template(
-        prompt_template,
+        plan.prompt_template,
         record,
-        schema_guidance=build_schema_guidance(constraints),
-    )
-    examples = _build_examples(domain)
-
-    # Use langextract for extraction (required for visualizations)
-    raw_triples = client.extract(
-        text=final_prompt,
-        prompt_description="Extract meaningful knowledge graph triples from the text, focusing on explicit relationships between entities.",
-        examples=examples,
-        format_type=Triple,
-        temperature=temperature,
-        max_tokens=max_tokens
+        schema_guidance=plan.schema_guidance,
     )
 
+    # Sampled responses are not replayed from the cache
+    cache_key = None
+    raw_triples = None
+    if cache is not None and not temperature:
+        cache_key = LLMCache.make_key(
+            method="extract",
+            client=type(client).__name__,
+            model=getattr(client, "model_id", None),
+            prompt=final_prompt,
+            prompt_description=_PROMPT_DESCRIPTION,
+            examples=plan.examples_digest,
+            max_tokens=max_tokens,
+            # Chunking and pass settings change what the client returns
+            extraction_passes=getattr(client, "extraction_passes", None),
+            max_char_buffer=getattr(client, "max_char_buffer", None),
+            batch_length=getattr(client, "batch_length", None),
+        )
+        raw_triples = cache.get(cache_key)
+
+    if raw_triples is None:
+        # Use langextract for extraction (required for visualizations)
+        raw_triples = client.extract(
+            text=final_prompt,
+            prompt_description=_PROMPT_DESCRIPTION,
+            examples=plan.examples,
+            format_type=Triple,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        if cache_key is not None:
+            cache.set(cache_key, raw_triples)
+
     triples = []
     normalized_raw_triples: list[dict[str, Any]] = []
     for t in raw_triples:
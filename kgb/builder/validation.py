@@ -8,13 +8,17 @@ post-generation validation.
 from __future__ import annotations
 
 import json
+import logging
 import re
 import warnings
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from ..domains import DomainSchema, ExtractionMode, KnowledgeDomain, Triple
 
+logger = logging.getLogger(__name__)
+
 _TYPE_RELATION_ALIASES = {
     "is_type",
     "is_type_of",
@@ -24,8 +28,10 @@ _TYPE_RELATION_ALIASES = {
     "category_of",
 }
 
+_LABEL_SEPARATOR_PATTERN = re.compile(r"[^a-z0-9]+")
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SchemaConstraints:
     """Normalized schema constraints used by the builder orchestrators."""
 
@@ -42,7 +48,7 @@ class SchemaConstraints:
 
 def normalize_constraint_label(value: str) -> str:
     """Normalize labels so schema validation tolerates case and punctuation variance."""
-    normalized = re.sub(r"[^a-z0-9]+", "_", value.strip().lower())
+    normalized = _LABEL_SEPARATOR_PATTERN.sub("_", value.strip().lower())
     return normalized.strip("_")
 
 
@@ -141,18 +147,33 @@ def build_schema_guidance(constraints: SchemaConstraints) -> str:
     return "\n".join(lines)
 
 
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{(record_json|schema_constraints)\}\}")
+
+
+@lru_cache(maxsize=64)
+def _compile_prompt_template(prompt_template: str) -> tuple[str, ...]:
+    """Split a template into alternating literal segments and placeholder names.
+
+    Even indices are literal text, odd indices are placeholder names. Cached
+    so each template is scanned once rather than on every render.
+    """
+    return tuple(_PLACEHOLDER_PATTERN.split(prompt_template))
+
+
 def render_prompt_template(
     prompt_template: str,
     record: dict[str, Any],
     schema_guidance: str = "",
 ) -> str:
     """Render a prompt template with the current record payload."""
-    prompt = prompt_template.replace(
-        "{{record_json}}",
-        json.dumps(record, ensure_ascii=False, indent=2)
-    )
-    prompt = prompt.replace("{{schema_constraints}}", schema_guidance)
-    if schema_guidance and "{{schema_constraints}}" not in prompt_template:
+    parts = _compile_prompt_template(prompt_template)
+    placeholders = parts[1::2]
+    values = {"schema_constraints": schema_guidance}
+    # Serializing the record dominates rendering cost; skip it when unused
+    if "record_json" in placeholders:
+        values["record_json"] = json.dumps(record, ensure_ascii=False, indent=2)
+    prompt = "".join(values[part] if i % 2 else part for i, part in enumerate(parts))
+    if schema_guidance and "schema_constraints" not in placeholders:
         prompt = f"{prompt.rstrip()}\n\n{schema_guidance}"
     return prompt
 
@@ -172,7 +193,7 @@ def normalize_triple(raw_triple: dict[str, Any]) -> Triple | None:
             justification=raw_triple.get("justification")
         )
     except Exception as e:
-        print(f"Warning: Skipping invalid triple: {e}")
+        logger.warning("Skipping invalid triple: %s", e)
         return None
 
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 from .base import BaseLLMClient, LLMClientError
 from .config import ClientConfig, ClientType
 from .factory import ClientFactory, client
+from .llm_cache import LLMCache
 from .providers import GeminiClient, OllamaClient, LMStudioClient
 
 __all__ = [
@@ -13,6 +14,7 @@ __all__ = [
     "ClientConfig",
     "ClientType",
     "ClientFactory",
+    "LLMCache",
     "GeminiClient",
     "OllamaClient",
     "LMStudioClient",
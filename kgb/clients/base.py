@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Sequence
 
 
 class LLMClientError(RuntimeError):
@@ -43,6 +44,52 @@ class BaseLLMClient(ABC):
         """
         pass
 
+    def extract_batch(
+        self,
+        texts: Sequence[str],
+        prompt_description: str,
+        examples: list[Any] | None = None,
+        format_type: type | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        max_concurrency: int = 1,
+        **kwargs: Any
+    ) -> list[list[dict[str, Any]]]:
+        """Extract from several texts with shared instructions and examples.
+
+        The default implementation calls extract() once per text. With
+        ``max_concurrency > 1`` the calls run in a thread pool so their
+        network latency overlaps. Clients with a native batch API may
+        override this.
+
+        Args:
+            texts: Input texts
+            prompt_description: Instructions for extraction
+            examples: Few-shot examples
+            format_type: Pydantic model for schema
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            max_concurrency: Maximum number of extract() calls in flight
+
+        Returns:
+            One list of extractions per input text, in input order
+        """
+        def _extract(text: str) -> list[dict[str, Any]]:
+            return self.extract(
+                text=text,
+                prompt_description=prompt_description,
+                examples=examples,
+                format_type=format_type,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            )
+
+        if max_concurrency <= 1 or len(texts) <= 1:
+            return [_extract(text) for text in texts]
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(_extract, texts))
+
     @abstractmethod
     def augment(
         self,
@@ -71,6 +118,64 @@ class BaseLLMClient(ABC):
         """
         pass
 
+    def augment_batch(
+        self,
+        texts: Sequence[str],
+        prompt_description: str,
+        format_type: type,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        max_concurrency: int = 1,
+        **kwargs: Any
+    ) -> list[list[dict[str, Any]]]:
+        """Augment several texts with shared instructions and schema.
+
+        Same contract as extract_batch(): one augment() call per text, run in
+        a thread pool when ``max_concurrency > 1``. Local servers with
+        parallel slots process the overlapping requests concurrently.
+
+        Args:
+            texts: Input texts
+            prompt_description: Instructions for augmentation
+            format_type: Pydantic model for schema enforcement
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            max_concurrency: Maximum number of augment() calls in flight
+
+        Returns:
+            One list of generated items per input text, in input order
+        """
+        def _augment(text: str) -> list[dict[str, Any]]:
+            return self.augment(
+                text=text,
+                prompt_description=prompt_description,
+                format_type=format_type,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            )
+
+        if max_concurrency <= 1 or len(texts) <= 1:
+            return [_augment(text) for text in texts]
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(_augment, texts))
+
+    def warmup(self) -> None:
+        """Prepare the backend before the first real request.
+
+        Local model servers load models lazily, so without a warmup the first
+        request of a run (and every request issued concurrently with it) waits
+        on the model load. Called once after the client is created. The
+        default does nothing; implementations must not raise.
+        """
+
+    def close(self) -> None:
+        """Release connections and caches held by the client.
+
+        Called once the client is no longer needed. The default does nothing;
+        implementations must be safe to call more than once.
+        """
+
     @classmethod
     @abstractmethod
     def from_config(cls, config: "ClientConfig") -> "BaseLLMClient":
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 ClientType = str
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientConfig:
     """Configuration for creating an LLM client.
 
@@ -41,5 +41,9 @@ class ClientConfig:
     base_url: str | None = None
     timeout: int = 120
 
+    # Response cache for deterministic augmentation calls (None = disabled)
+    cache_dir: str | None = None
+    cache_ttl: int | None = None  # Seconds; None = entries never expire
+
 
 __all__ = ["ClientConfig", "ClientType"]
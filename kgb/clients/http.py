@@ -0,0 +1,38 @@
+"""Pooled HTTP sessions for the local-server clients (Ollama, LM Studio).
+
+A module-level ``requests.post`` opens a new connection per call; a shared
+session keeps connections alive across the many requests of a run.
+"""
+
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def build_session(pool_size: int = 10) -> requests.Session:
+    """Create a session with a keep-alive pool and retries on gateway errors.
+
+    Generation requests have no side effects, so POSTs are retried when a
+    proxy or a server that is still loading the model answers 502/503/504.
+    The final response is returned as-is for ``raise_for_status``.
+
+    Args:
+        pool_size: Connections kept open per host
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+__all__ = ["build_session"]
@@ -0,0 +1,111 @@
+"""Persistent cache for deterministic LLM responses.
+
+Re-running extraction over the same inputs (reruns, iterative prompt work,
+datasets with duplicate rows) otherwise pays for identical LLM calls again.
+Entries are keyed by a SHA-256 of the full request, so any change to the
+prompt, examples, model or generation parameters produces a new key.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+_DB_NAME = "cache.sqlite3"
+
+
+def default_cache_dir() -> Path:
+    """Return the default cache directory (``$XDG_CACHE_HOME/kgb/llm``)."""
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "kgb" / "llm"
+
+
+class LLMCache:
+    """On-disk cache of LLM responses in a single SQLite database.
+
+    The database runs in WAL mode, so several processes (or threads) pointed
+    at the same directory share entries without blocking each other's reads.
+
+    Only use it for deterministic calls (temperature 0); sampled responses
+    are not meant to be replayed.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the cache database (default: ``default_cache_dir()``)
+            ttl_seconds: Lifetime of new entries in seconds (default: never expire)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.cache_dir / _DB_NAME,
+            timeout=30,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, created REAL NOT NULL, expires REAL, value TEXT NOT NULL)"
+        )
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Hash request parts into a stable cache key."""
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for a key, or None on a miss or expiry."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (key, time.time()),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under a key."""
+        now = time.time()
+        expires = now + self.ttl_seconds if self.ttl_seconds else None
+        payload = json.dumps(value, ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, created, expires, value) VALUES (?, ?, ?, ?)",
+                (key, now, expires, payload),
+            )
+
+    def close(self) -> None:
+        """Close the database connection. Safe to call more than once."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> LLMCache:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+__all__ = ["LLMCache", "default_cache_dir"]
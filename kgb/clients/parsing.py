@@ -0,0 +1,330 @@
+"""Shared JSON helpers for LLM requests and responses.
+
+Augmentation responses can carry many triples per call, so JSON handling
+uses orjson when it is installed and falls back to the stdlib otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from functools import lru_cache
+from typing import Any, Iterable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_FENCE_PATTERN = re.compile(r"```(?:json)?\s*([\s\S]*?)```")
+
+
+def loads_json(data: str | bytes) -> Any:
+    """Parse a JSON document, using orjson when available.
+
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON (orjson's
+            decode error subclasses it, so callers can catch either way)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj: Any, indent: int | None = None) -> str:
+    """Serialize to JSON text, using orjson when available.
+
+    Output is compact by default: it is meant for prompts, where whitespace
+    only costs tokens. Pass ``indent`` for files meant to be read by people;
+    orjson handles ``indent=2`` itself. The text is equivalent JSON either
+    way, but not always byte-identical to the stdlib's (orjson writes
+    ``1e-7`` where ``json`` writes ``1e-07``). Payloads orjson rejects,
+    such as integers wider than 64 bits, fall back to the stdlib.
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent else 0
+        try:
+            return orjson.dumps(obj, option=option).decode("utf-8")
+        except TypeError:
+            pass
+    if indent is None:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(obj, ensure_ascii=False, indent=indent)
+
+
+@lru_cache(maxsize=64)
+def schema_json(format_type: type, indent: int | None = None) -> str:
+    """Serialized JSON schema of a Pydantic model, built once per class.
+
+    ``model_json_schema()`` walks the whole model graph, and the schema of a
+    class never changes, so every client shares one cached string.
+
+    Args:
+        format_type: Pydantic model class
+        indent: Indentation for human-readable output (default: compact)
+    """
+    return dumps_json(format_type.model_json_schema(), indent=indent)
+
+
+@lru_cache(maxsize=32)
+def augment_preamble(prompt_description: str, format_type: type, indent: int | None = None) -> str:
+    """Static system prompt for augmentation requests, built once per input.
+
+    Every record in a run shares one preamble string instead of
+    re-serializing the schema and re-concatenating the instructions.
+
+    Args:
+        prompt_description: Instructions for generation
+        format_type: Pydantic model describing each returned object
+        indent: Schema indentation (default: compact)
+    """
+    return f"""{prompt_description}
+
+Return the results as a JSON array of objects matching this JSON schema:
+{schema_json(format_type, indent=indent)}"""
+
+
+class _BracketScanner:
+    """Incremental bracket-depth tracker for JSON text.
+
+    Brackets inside string literals are ignored. Text can be fed in pieces,
+    so a streamed value is scanned once overall rather than once per chunk.
+    """
+
+    __slots__ = ("depth", "in_string", "escaped")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str) -> int | None:
+        """Scan ``text``; return the index where depth returns to zero, or None."""
+        depth, in_string, escaped = self.depth, self.in_string, self.escaped
+        end = None
+        for i, ch in enumerate(text):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch == "[" or ch == "{":
+                depth += 1
+            elif ch == "]" or ch == "}":
+                depth -= 1
+                if depth == 0:
+                    end = i
+                    break
+        self.depth, self.in_string, self.escaped = depth, in_string, escaped
+        return end
+
+
+def extract_json_span(text: str, openers: str = "[{") -> str | None:
+    """Return the first balanced JSON array/object embedded in ``text``.
+
+    Scans once from the first opening bracket, tracking nesting depth and
+    string literals (so brackets inside strings do not count). Unlike a
+    greedy bracket-to-bracket regex, this stays linear on long or truncated
+    responses and ignores trailing prose that contains brackets.
+
+    Args:
+        text: Raw model output
+        openers: Opening characters to accept (``"["`` for arrays only)
+
+    Returns:
+        The bracketed substring, or None if no balanced span is found
+    """
+    positions = [pos for pos in (text.find(ch) for ch in openers) if pos >= 0]
+    if not positions:
+        return None
+    start = min(positions)
+
+    end = _BracketScanner().feed(text[start:])
+    return text[start:start + end + 1] if end is not None else None
+
+
+def _largest_parsable_span(text: str, openers: str) -> tuple[str, Any] | None:
+    """Return the longest top-level balanced span in ``text`` that is valid JSON.
+
+    Prose around the payload can hold bracketed text that is JSON too
+    (``"Here are [3] triples:"``), so the first parsable span is not
+    necessarily the payload; the largest one is. Balanced spans are
+    skipped whole, so values nested inside a candidate are not considered
+    on their own.
+
+    Returns:
+        ``(span, parsed value)``, or None if no span parses
+    """
+    best: tuple[str, Any] | None = None
+    pos = 0
+    while True:
+        positions = [p for p in (text.find(ch, pos) for ch in openers) if p >= 0]
+        if not positions:
+            return best
+        start = min(positions)
+        span = extract_json_span(text[start:], openers)
+        if span is None:
+            pos = start + 1
+            continue
+        pos = start + len(span)
+        if best is not None and len(span) <= len(best[0]):
+            continue
+        try:
+            best = (span, loads_json(span))
+        except json.JSONDecodeError:
+            continue
+
+
+def parse_json_text(text: str) -> Any:
+    """Parse the JSON payload of a model response.
+
+    Output that already is bare JSON (what the prompts ask for, and the
+    common case) is parsed directly, without any scanning. Otherwise a
+    markdown fence is unwrapped and the largest balanced array/object that
+    parses is taken.
+
+    Raises:
+        json.JSONDecodeError: If no JSON payload can be found
+    """
+    text = text.strip()
+    if text[:1] in ("[", "{") and text[-1:] in ("]", "}"):
+        # Prose can also start and end with brackets, e.g. "[note] ... [...]"
+        try:
+            return loads_json(text)
+        except json.JSONDecodeError:
+            pass
+
+    if text.startswith("```"):
+        match = _FENCE_PATTERN.search(text)
+        if match:
+            text = match.group(1).strip()
+    found = _largest_parsable_span(text, "[{")
+    if found is not None:
+        return found[1]
+    # Nothing parses; let the parser produce the error for the caller
+    return loads_json(text)
+
+
+def grounded_triple(extraction: Any) -> dict[str, Any] | None:
+    """Convert a langextract extraction into a grounded triple dictionary.
+
+    Attributes normally carry the triple; some langextract versions instead
+    put a flat JSON object in ``extraction_text``, which is parsed as a
+    fallback.
+
+    Returns:
+        The attributes plus ``char_start``/``char_end`` and extraction
+        metadata, or None if head, relation or tail is missing
+    """
+    attrs = extraction.attributes
+    if attrs is None and isinstance(extraction.extraction_text, str):
+        text_trimmed = extraction.extraction_text.strip()
+        if text_trimmed.startswith("{") and text_trimmed.endswith("}"):
+            try:
+                attrs = loads_json(text_trimmed)
+            except json.JSONDecodeError:
+                attrs = None
+
+    if not isinstance(attrs, dict) or not all(k in attrs for k in ("head", "relation", "tail")):
+        return None
+
+    interval = extraction.char_interval
+    return {
+        **attrs,
+        "char_start": interval.start_pos if interval else None,
+        "char_end": interval.end_pos if interval else None,
+        "extraction_text": str(extraction.extraction_text),
+        "extraction_class": str(extraction.extraction_class),
+    }
+
+
+def _payload_start(text: str) -> int | None:
+    """Locate the value a response opens with, if it opens with one.
+
+    Leading whitespace and an opening markdown fence are skipped.
+
+    Returns:
+        Index of the leading ``[``/``{``, -1 if the response starts with
+        anything else (prose), or None if too little text has arrived
+    """
+    i = len(text) - len(text.lstrip())
+    if i == len(text):
+        return None
+    if text.startswith("```", i):
+        newline = text.find("\n", i)
+        if newline < 0:
+            return None
+        rest = text[newline + 1:]
+        stripped = rest.lstrip()
+        if not stripped:
+            return None
+        i = newline + 1 + len(rest) - len(stripped)
+    elif "```".startswith(text[i:]):
+        return None
+    return i if text[i] in "[{" else -1
+
+
+def collect_until_json(chunks: Iterable[str]) -> tuple[str, Any | None]:
+    """Join streamed text chunks, stopping once the leading JSON value is complete.
+
+    Verbose models often keep generating after the requested array (notes,
+    a second copy, a closing fence). When the response opens with a JSON
+    value (optionally inside a markdown fence), reading stops as soon as
+    that outermost array/object is balanced and parses, which saves those
+    tokens; the caller closes the stream. Responses that open with prose
+    are read to the end: bracketed text inside prose can itself be valid
+    JSON (``"Here are [3] triples"``), so no early cut is safe there.
+
+    Args:
+        chunks: Text fragments in arrival order
+
+    Returns:
+        ``(text, value)``: the accumulated text, and the parsed leading
+        value if reading stopped early (None otherwise, in which case the
+        caller parses the text with ``parse_json_text``)
+    """
+    parts: list[str] = []
+    start: int | None = None  # None = undecided, -1 = read to the end
+    scanner = _BracketScanner()
+    offset = 0
+    for chunk in chunks:
+        parts.append(chunk)
+        chunk_offset = offset
+        offset += len(chunk)
+
+        if start is None:
+            text = "".join(parts)
+            start = _payload_start(text)
+            if start is None or start < 0:
+                continue
+            segment, segment_offset = text[start:], start
+        elif start >= 0:
+            segment, segment_offset = chunk, chunk_offset
+        else:
+            continue
+
+        end = scanner.feed(segment)
+        if end is not None:
+            text = "".join(parts)
+            try:
+                return text, loads_json(text[start:segment_offset + end + 1])
+            except json.JSONDecodeError:
+                # The leading value is malformed; let the full-text parse decide
+                start = -1
+    return "".join(parts), None
+
+
+__all__ = [
+    "loads_json",
+    "dumps_json",
+    "schema_json",
+    "augment_preamble",
+    "extract_json_span",
+    "parse_json_text",
+    "grounded_triple",
+    "collect_until_json",
+]
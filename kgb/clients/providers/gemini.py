@@ -13,11 +13,10 @@ from __future__ import annotations
 import os
 from typing import TYPE_CHECKING, Any
 
-import langextract as lx
-
 from ..base import BaseLLMClient, LLMClientError
 from ..defaults import load_provider_defaults
 from ..factory import client
+from ..parsing import augment_preamble, loads_json
 
 if TYPE_CHECKING:
     from ..config import ClientConfig
@@ -72,6 +71,11 @@ class GeminiClient(BaseLLMClient):
         # Set API key in environment for langextract
         os.environ["LANGEXTRACT_API_KEY"] = self.api_key
 
+        # Augmentation models keyed by their static system instruction; each
+        # keeps its SDK transport (and open connections) across calls
+        self._augment_models: dict[str, Any] = {}
+        self._request_options: dict[str, Any] | None = None
+
     def extract(
         self,
         text: str,
@@ -108,6 +112,8 @@ class GeminiClient(BaseLLMClient):
         Raises:
             LLMClientError: If extraction fails
         """
+        import langextract as lx
+
         try:
             # Build langextract parameters
             lx_kwargs = {
@@ -174,18 +180,32 @@ class GeminiClient(BaseLLMClient):
         import json
 
         try:
-            # Configure genai with the API key
-            genai.configure(api_key=self.api_key)
-            model = genai.GenerativeModel(self.model_id)
+            # The instructions and schema are identical across records, so they
+            # go in the system instruction and only the input text varies. This
+            # keeps a stable prefix that Gemini can serve from its prompt cache.
+            preamble = augment_preamble(prompt_description, format_type)
+            model = self._augment_models.get(preamble)
+            if model is None:
+                genai.configure(api_key=self.api_key)
+                model = genai.GenerativeModel(self.model_id, system_instruction=preamble)
+                self._augment_models[preamble] = model
+
+            if self._request_options is None:
+                from google.api_core import retry
+
+                # Back off and retry rate limits (429) and transient 5xx errors
+                # instead of failing the whole augmentation iteration
+                self._request_options = {
+                    "retry": retry.Retry(
+                        predicate=retry.if_transient_error,
+                        initial=1.0,
+                        multiplier=2.0,
+                        maximum=30.0,
+                        timeout=120.0,
+                    )
+                }
 
-            # Build the prompt
-            schema_json = json.dumps(format_type.model_json_schema(), indent=2)
             full_prompt = f"""
-{prompt_description}
-
-Return the results as a JSON list of objects matching this JSON schema:
-{schema_json}
-
 Input Text:
 {text}
 """
@@ -201,15 +221,18 @@ Input Text:
             # Call the model
             response = model.generate_content(
                 full_prompt,
-                generation_config=generation_config
+                generation_config=generation_config,
+                request_options=self._request_options,
             )
 
-            # Parse the JSON response
-            if not response.text:
+            # Parse the JSON response (response.text is a property that
+            # re-joins the candidate parts on every access; read it once)
+            response_text = response.text
+            if not response_text:
                 return []
 
             try:
-                data = json.loads(response.text)
+                data = loads_json(response_text)
                 if isinstance(data, list):
                     return data
                 elif isinstance(data, dict):
@@ -220,7 +243,7 @@ Input Text:
                     return [data]
                 return []
             except json.JSONDecodeError as e:
-                raise LLMClientError(f"Failed to parse JSON response: {e}\nResponse text: {response.text}")
+                raise LLMClientError(f"Failed to parse JSON response: {e}\nResponse text: {response_text}")
 
         except Exception as e:
             raise LLMClientError(f"Gemini JSON generation failed: {e}") from e
@@ -298,6 +321,8 @@ Input Text:
         Returns:
             langextract AnnotatedDocument with full extraction results
         """
+        import langextract as lx
+
         try:
             lx_kwargs = {
                 "text_or_documents": text,
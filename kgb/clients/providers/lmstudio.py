@@ -2,127 +2,53 @@
 
 from __future__ import annotations
 
-import dataclasses
-from typing import TYPE_CHECKING, Any
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator
 
-import langextract as lx
-from langextract.providers.openai import OpenAILanguageModel
-from langextract.core import types as core_types
-from langextract.core import exceptions
+import requests
 
 from ..base import BaseLLMClient, LLMClientError
 from ..defaults import load_provider_defaults
 from ..factory import client
+from ..http import build_session
+from ..llm_cache import LLMCache
+from ..parsing import augment_preamble, collect_until_json, dumps_json, grounded_triple, loads_json, parse_json_text
 
 if TYPE_CHECKING:
     from ..config import ClientConfig
+    from .lmstudio_model import LMStudioLanguageModel
 
+logger = logging.getLogger(__name__)
 
-@dataclasses.dataclass(init=False)
-class LMStudioLanguageModel(OpenAILanguageModel):
-    """Custom OpenAI-compatible model for LM Studio that doesn't use response_format.
-    
-    LM Studio rejects the response_format: json_object parameter that langextract's
-    OpenAI provider sends. This subclass overrides the prompt processing to remove
-    that parameter while keeping all other langextract functionality.
-    """
-    
-    # Additional field for LM Studio
-    timeout: int = 120
-
-    def __init__(
-        self,
-        model_id: str = 'local-model',
-        api_key: str | None = None,
-        base_url: str | None = None,
-        organization: str | None = None,
-        temperature: float | None = None,
-        max_workers: int = 5,
-        timeout: int = 120,
-        **kwargs,
-    ) -> None:
-        """Initialize LM Studio language model with JSON format type."""
-        from langextract.core.data import FormatType
-        
-        # Initialize parent with JSON format type 
-        super().__init__(
-            model_id=model_id,
-            api_key=api_key,
-            base_url=base_url,
-            organization=organization,
-            format_type=FormatType.JSON,
-            temperature=temperature,
-            max_workers=max_workers,
-            **kwargs,
-        )
-        self.timeout = timeout
+def _iter_stream_content(response: requests.Response) -> Iterator[str]:
+    """Yield message content deltas from an OpenAI-style SSE stream.
 
-    @property
-    def requires_fence_output(self) -> bool:
-        """LM Studio doesn't use structured output, so we expect fenced JSON."""
-        return True
-
-    def _process_single_prompt(
-        self, prompt: str, config: dict
-    ) -> core_types.ScoredOutput:
-        """Process a single prompt without sending response_format parameter."""
+    Raises:
+        LLMClientError: If the server reports an error mid-stream
+    """
+    for line in response.iter_lines():
+        if not line.startswith(b"data:"):
+            continue
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            return
         try:
-            normalized_config = self._normalize_reasoning_params(config)
-
-            # System message for JSON output (without using response_format API param)
-            system_message = (
-                "You are a helpful assistant that extracts information into structured JSON. "
-                "Follow the provided format Exactly, matching the field names and structure of the examples. "
-                "Do not include any preamble or extra explanations."
-            )
-
-            messages = [{'role': 'user', 'content': prompt}]
-            messages.insert(0, {'role': 'system', 'content': system_message})
-
-            api_params = {
-                'model': self.model_id,
-                'messages': messages,
-                'n': 1,
-            }
-
-            temp = normalized_config.get('temperature', self.temperature)
-            if temp is not None:
-                api_params['temperature'] = temp
-
-            # DO NOT add response_format - LM Studio doesn't support it properly
-            # The system message and fence_output will handle JSON parsing
-
-            if (v := normalized_config.get('max_output_tokens')) is not None:
-                api_params['max_tokens'] = v
-            if (v := normalized_config.get('top_p')) is not None:
-                api_params['top_p'] = v
-            for key in [
-                'frequency_penalty',
-                'presence_penalty',
-                'seed',
-                'stop',
-                'logprobs',
-                'top_logprobs',
-                'reasoning',
-                # Explicitly exclude 'response_format' from being passed
-            ]:
-                if (v := normalized_config.get(key)) is not None:
-                    api_params[key] = v
-
-            response = self._client.chat.completions.create(**api_params)
-            output_text = response.choices[0].message.content
-
-            # Sanitize control characters that break JSON parsing
-            if output_text:
-                import re
-                output_text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f]', ' ', output_text)
-
-            return core_types.ScoredOutput(score=1.0, output=output_text)
-
-        except Exception as e:
-            raise exceptions.InferenceRuntimeError(
-                f'LM Studio API error: {str(e)}', original=e
-            ) from e
+            event = loads_json(data)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(event, dict) and "error" in event:
+            error = event["error"]
+            message = error.get("message", error) if isinstance(error, dict) else error
+            raise LLMClientError(f"LM Studio error: {message}")
+        try:
+            content = event["choices"][0]["delta"].get("content")
+        except (KeyError, IndexError, TypeError, AttributeError):
+            continue
+        if content:
+            yield content
 
 
 @client("lmstudio")
@@ -142,7 +68,9 @@ class LMStudioClient(BaseLLMClient):
         batch_length: int | None = None,
         max_char_buffer: int = 8000,
         show_progress: bool = True,
-        timeout: int = 120
+        timeout: int = 120,
+        cache_dir: str | Path | None = None,
+        cache_ttl: int | None = None,
     ) -> None:
         """Initialize LM Studio client.
 
@@ -155,6 +83,8 @@ class LMStudioClient(BaseLLMClient):
             max_char_buffer: Maximum characters for inference
             show_progress: Whether to show progress bar
             timeout: Request timeout in seconds
+            cache_dir: Directory for caching deterministic augment responses
+            cache_ttl: Lifetime of cached responses in seconds (None = forever)
         """
         _defaults = load_provider_defaults("lmstudio")
         self.model_id = model_id or _defaults["model_id"]
@@ -165,6 +95,55 @@ class LMStudioClient(BaseLLMClient):
         self.max_char_buffer = max_char_buffer
         self.show_progress = show_progress
         self.timeout = timeout
+        self._cache = LLMCache(cache_dir, ttl_seconds=cache_ttl) if cache_dir else None
+        self._session = build_session(max(10, self.max_workers or 0))
+        self._lx_model: LMStudioLanguageModel | None = None
+        self._lx_model_lock = threading.Lock()
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+        }
+
+    def warmup(self) -> None:
+        """Trigger LM Studio's just-in-time model load with a one-token request."""
+        try:
+            self._session.post(
+                f"{self.base_url}/chat/completions",
+                headers=self._headers,
+                json={
+                    "model": self.model_id,
+                    "messages": [{"role": "user", "content": "ping"}],
+                    "max_tokens": 1,
+                },
+                timeout=self.timeout,
+            ).raise_for_status()
+        except requests.RequestException as e:
+            logger.debug("LM Studio warmup failed: %s", e)
+
+    def close(self) -> None:
+        """Close the HTTP session and the response cache."""
+        self._session.close()
+        if self._cache is not None:
+            self._cache.close()
+
+    def _get_lx_model(self) -> LMStudioLanguageModel:
+        """Return the langextract model, creating it on first use.
+
+        The model wraps an OpenAI SDK client with its own connection pool,
+        so one instance is shared by all extract() calls on this client.
+        """
+        with self._lx_model_lock:
+            if self._lx_model is None:
+                from .lmstudio_model import LMStudioLanguageModel
+
+                # Our custom LMStudioLanguageModel removes the response_format parameter
+                self._lx_model = LMStudioLanguageModel(
+                    model_id=self.model_id,
+                    api_key=self.api_key,
+                    base_url=self.base_url,
+                    timeout=self.timeout,
+                )
+            return self._lx_model
 
     def extract(
         self,
@@ -193,14 +172,10 @@ class LMStudioClient(BaseLLMClient):
         Raises:
             LLMClientError: If extraction fails
         """
+        import langextract as lx
+
         try:
-            # Use our custom LMStudioLanguageModel that removes response_format parameter
-            lmstudio_model = LMStudioLanguageModel(
-                model_id=self.model_id,
-                api_key=self.api_key,
-                base_url=self.base_url,
-                timeout=self.timeout,
-            )
+            lmstudio_model = self._get_lx_model()
 
             # Prepare langextract kwargs
             # LM Studio has limited OpenAI API compatibility
@@ -233,43 +208,11 @@ class LMStudioClient(BaseLLMClient):
             )
 
             # Extract triples from result
-            triples = []
-            if hasattr(result, 'extractions') and result.extractions:
-                for extraction in result.extractions:
-                    # Robust attribute extraction (handles both wrapped and flat formats)
-                    attrs = extraction.attributes
-                    
-                    # If attributes is None, it might be a flat dict in extraction_text or data
-                    if attrs is None:
-                        # Some versions of langextract might put the dict in extraction_text if it's flat
-                        if isinstance(extraction.extraction_text, str):
-                            try:
-                                import json
-                                text_trimmed = extraction.extraction_text.strip()
-                                if text_trimmed.startswith('{') and text_trimmed.endswith('}'):
-                                    attrs = json.loads(text_trimmed)
-                            except:
-                                pass
-                    
-                    if attrs:
-                        # Ensure it's a dict
-                        triple = dict(attrs)
-                        
-                        # Add source grounding information from langextract
-                        if extraction.char_interval:
-                            triple["char_start"] = extraction.char_interval.start_pos
-                            triple["char_end"] = extraction.char_interval.end_pos
-                        else:
-                            triple["char_start"] = None
-                            triple["char_end"] = None
-                        
-                        # Add extraction metadata
-                        triple["extraction_text"] = str(extraction.extraction_text)
-                        triple["extraction_class"] = str(extraction.extraction_class)
-                        
-                        # Basic validation: must have head, relation, tail
-                        if all(k in triple for k in ('head', 'relation', 'tail')):
-                            triples.append(triple)
+            triples = [
+                triple
+                for extraction in getattr(result, "extractions", None) or ()
+                if (triple := grounded_triple(extraction)) is not None
+            ]
 
             return triples
 
@@ -302,19 +245,24 @@ class LMStudioClient(BaseLLMClient):
         Returns:
             List of dictionaries matching the requested schema
         """
-        import json
-        import re
-        import requests
+        cache_key = None
+        if self._cache is not None and not temperature:
+            cache_key = LLMCache.make_key(
+                method="augment",
+                client="lmstudio",
+                model=self.model_id,
+                text=text,
+                system=augment_preamble(prompt_description, format_type, indent=2),
+                max_tokens=max_tokens,
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         try:
-            # Build the prompt with schema
-            schema_json = json.dumps(format_type.model_json_schema(), indent=2)
-            full_prompt = f"""
-{prompt_description}
-
-Return the results as a JSON array of objects matching this schema:
-{schema_json}
-
+            # Static instructions + schema go in the system message; only the
+            # input text varies per record
+            user_prompt = f"""
 Input Text:
 {text}
 
@@ -325,49 +273,37 @@ IMPORTANT: Respond with ONLY a valid JSON array. No markdown code blocks, no exp
             payload = {
                 "model": self.model_id,
                 "messages": [
-                    {"role": "user", "content": full_prompt}
+                    {"role": "system", "content": augment_preamble(prompt_description, format_type, indent=2)},
+                    {"role": "user", "content": user_prompt},
                 ],
                 "temperature": temperature if temperature is not None else 0.0,
+                "stream": True,
             }
             if max_tokens:
                 payload["max_tokens"] = max_tokens
 
-            # Call LM Studio's OpenAI-compatible API
-            response = requests.post(
+            # Call LM Studio's OpenAI-compatible API; the body is serialized
+            # here so the fast encoder is used instead of requests' stdlib path.
+            # The reply is streamed and reading stops at the first complete
+            # JSON array, closing the connection on anything generated after it.
+            with self._session.post(
                 f"{self.base_url}/chat/completions",
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.api_key}"
-                },
-                json=payload,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-
-            result = response.json()
-            response_text = result.get("choices", [{}])[0].get("message", {}).get("content", "")
+                headers=self._headers,
+                data=dumps_json(payload).encode("utf-8"),
+                timeout=self.timeout,
+                stream=True,
+            ) as response:
+                response.raise_for_status()
+                response_text, data = collect_until_json(_iter_stream_content(response))
 
             if not response_text:
                 return []
 
-            # Try to extract JSON from the response (handle markdown code blocks, etc.)
-            response_text = response_text.strip()
-            
-            # Remove markdown code blocks if present
-            if response_text.startswith("```"):
-                # Extract content between code blocks
-                match = re.search(r"```(?:json)?\s*([\s\S]*?)```", response_text)
-                if match:
-                    response_text = match.group(1).strip()
-            
-            # Find JSON array or object in the response
-            json_match = re.search(r'(\[[\s\S]*\]|\{[\s\S]*\})', response_text)
-            if json_match:
-                response_text = json_match.group(1)
-
-            # Parse the JSON response
+            # Parse the JSON response unless the stream already did (handles
+            # markdown code blocks and surrounding prose)
             try:
-                data = json.loads(response_text)
+                if data is None:
+                    data = parse_json_text(response_text)
                 if isinstance(data, list):
                     items = data
                 elif isinstance(data, dict):
@@ -386,7 +322,9 @@ IMPORTANT: Respond with ONLY a valid JSON array. No markdown code blocks, no exp
                 for item in items:
                     if isinstance(item, dict):
                         item['inference'] = 'contextual'
-                
+
+                if cache_key is not None and items:
+                    self._cache.set(cache_key, items)
                 return items
             except json.JSONDecodeError as e:
                 raise LLMClientError(f"Failed to parse JSON response: {e}\nResponse text: {response_text[:500]}")
@@ -408,6 +346,8 @@ IMPORTANT: Respond with ONLY a valid JSON array. No markdown code blocks, no exp
             max_char_buffer=config.max_char_buffer,
             show_progress=config.show_progress,
             timeout=config.timeout,
+            cache_dir=config.cache_dir,
+            cache_ttl=config.cache_ttl,
         )
 
 
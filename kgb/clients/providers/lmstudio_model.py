@@ -0,0 +1,125 @@
+"""langextract model for LM Studio's OpenAI-compatible endpoint.
+
+Kept apart from the client so that langextract (and the OpenAI SDK it pulls
+in) is only imported when extraction actually runs; augmentation bypasses it.
+"""
+
+from __future__ import annotations
+
+import re
+
+from langextract.providers.openai import OpenAILanguageModel
+from langextract.core import types as core_types
+from langextract.core import exceptions
+
+# Control-character cleanup pattern, compiled once for all requests
+_CONTROL_CHARS_PATTERN = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+class LMStudioLanguageModel(OpenAILanguageModel):
+    """Custom OpenAI-compatible model for LM Studio that doesn't use response_format.
+    
+    LM Studio rejects the response_format: json_object parameter that langextract's
+    OpenAI provider sends. This subclass overrides the prompt processing to remove
+    that parameter while keeping all other langextract functionality.
+
+    Deliberately not re-decorated as a dataclass: the custom __init__ already
+    sets every attribute, and a generated field-by-field __eq__/__repr__ over
+    the inherited fields buys nothing.
+    """
+
+    def __init__(
+        self,
+        model_id: str = 'local-model',
+        api_key: str | None = None,
+        base_url: str | None = None,
+        organization: str | None = None,
+        temperature: float | None = None,
+        max_workers: int = 5,
+        timeout: int = 120,
+        **kwargs,
+    ) -> None:
+        """Initialize LM Studio language model with JSON format type."""
+        from langextract.core.data import FormatType
+        
+        # Initialize parent with JSON format type 
+        super().__init__(
+            model_id=model_id,
+            api_key=api_key,
+            base_url=base_url,
+            organization=organization,
+            format_type=FormatType.JSON,
+            temperature=temperature,
+            max_workers=max_workers,
+            **kwargs,
+        )
+        self.timeout = timeout
+
+    @property
+    def requires_fence_output(self) -> bool:
+        """LM Studio doesn't use structured output, so we expect fenced JSON."""
+        return True
+
+    def _process_single_prompt(
+        self, prompt: str, config: dict
+    ) -> core_types.ScoredOutput:
+        """Process a single prompt without sending response_format parameter."""
+        try:
+            normalized_config = self._normalize_reasoning_params(config)
+
+            # System message for JSON output (without using response_format API param)
+            system_message = (
+                "You are a helpful assistant that extracts information into structured JSON. "
+                "Follow the provided format Exactly, matching the field names and structure of the examples. "
+                "Do not include any preamble or extra explanations."
+            )
+
+            messages = [{'role': 'user', 'content': prompt}]
+            messages.insert(0, {'role': 'system', 'content': system_message})
+
+            api_params = {
+                'model': self.model_id,
+                'messages': messages,
+                'n': 1,
+            }
+
+            temp = normalized_config.get('temperature', self.temperature)
+            if temp is not None:
+                api_params['temperature'] = temp
+
+            # DO NOT add response_format - LM Studio doesn't support it properly
+            # The system message and fence_output will handle JSON parsing
+
+            if (v := normalized_config.get('max_output_tokens')) is not None:
+                api_params['max_tokens'] = v
+            if (v := normalized_config.get('top_p')) is not None:
+                api_params['top_p'] = v
+            for key in [
+                'frequency_penalty',
+                'presence_penalty',
+                'seed',
+                'stop',
+                'logprobs',
+                'top_logprobs',
+                'reasoning',
+                # Explicitly exclude 'response_format' from being passed
+            ]:
+                if (v := normalized_config.get(key)) is not None:
+                    api_params[key] = v
+
+            response = self._client.chat.completions.create(**api_params)
+            output_text = response.choices[0].message.content
+
+            # Sanitize control characters that break JSON parsing
+            if output_text:
+                output_text = _CONTROL_CHARS_PATTERN.sub(' ', output_text)
+
+            return core_types.ScoredOutput(score=1.0, output=output_text)
+
+        except Exception as e:
+            raise exceptions.InferenceRuntimeError(
+                f'LM Studio API error: {str(e)}', original=e
+            ) from e
+
+
+__all__ = ["LMStudioLanguageModel"]
@@ -1,101 +1,44 @@
-import dataclasses
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Iterator, Sequence, Mapping
-import langextract as lx
-from langextract.providers.openai import OpenAILanguageModel
-from langextract.core import types as core_types
-from langextract.core import exceptions as lx_exceptions
+import requests
 
 from ..base import BaseLLMClient, LLMClientError
 from ..defaults import load_provider_defaults
 from ..factory import client
+from ..http import build_session
+from ..llm_cache import LLMCache
+from ..parsing import augment_preamble, collect_until_json, grounded_triple, loads_json, parse_json_text
 
 if TYPE_CHECKING:
     from ..config import ClientConfig
+    from .ollama_model import OllamaOpenAILanguageModel
 
+logger = logging.getLogger(__name__)
 
-@dataclasses.dataclass(init=False)
-class OllamaOpenAILanguageModel(OpenAILanguageModel):
-    """Custom OpenAI model for Ollama that removes unsupported response_format."""
-
-    def __init__(self, **kwargs):
-        # Extract timeout before super().__init__ discards it via **kwargs
-        self._request_timeout = kwargs.pop("timeout", 600)
-        super().__init__(**kwargs)
-        # Recreate OpenAI client with proper timeout for slow local models
-        import openai
-        self._client = openai.OpenAI(
-            api_key=self.api_key,
-            base_url=self.base_url,
-            organization=self.organization,
-            timeout=self._request_timeout,
-        )
-        
-    @property
-    def requires_fence_output(self) -> bool:
-        """Ollama/LM Studio output needs fences when not using structured mode."""
-        return True
-
-    @staticmethod
-    def _sanitize_control_chars(text: str) -> str:
-        """Remove invalid JSON control characters from LLM output.
-
-        Some local models emit raw control characters (tabs, newlines, etc.)
-        inside JSON string values, which causes json.loads() to fail with
-        'Invalid control character'.  We replace them with spaces.
-        """
-        import re
-        # Replace control chars (U+0000–U+001F) except \n \r \t which are
-        # commonly present in fenced output and handled by langextract.
-        # Inside JSON *strings* these are illegal, but we can't easily
-        # distinguish string-interior vs structural whitespace here, so we
-        # only strip the truly unusual ones (NUL, BEL, BS, VT, FF, etc.).
-        return re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f]', ' ', text)
-
-    def _process_single_prompt(self, prompt: str, config: dict[str, Any]) -> core_types.ScoredOutput:
-        """Override to remove response_format and add logging."""
-        try:
-            # Get model configuration
-            model_config = self.merge_kwargs(config)
-
-            # Explicitly remove response_format as it can cause issues in Ollama/LM Studio
-            model_config.pop('response_format', None)
-
-            # Standard system message for JSON
-            system_message = (
-                "You are a helpful assistant that extracts information into structured JSON. "
-                "Follow the provided format Exactly, matching the field names and structure of the examples. "
-                "You may use ```json code fences. Do not include any preamble or extra explanations."
-            )
-
-            messages = [{'role': 'user', 'content': prompt}]
-            messages.insert(0, {'role': 'system', 'content': system_message})
-
-            api_params = {
-                'model': self.model_id,
-                'messages': messages,
-                'n': 1,
-            }
-
-            temp = model_config.get('temperature', self.temperature)
-            if temp is not None:
-                api_params['temperature'] = temp
-
-            if (v := model_config.get('max_output_tokens')) is not None:
-                api_params['max_tokens'] = v
-
-            response = self._client.chat.completions.create(**api_params)
-            output_text = response.choices[0].message.content
-
-            # Sanitize control characters that break JSON parsing
-            if output_text:
-                output_text = self._sanitize_control_chars(output_text)
+def _iter_stream_content(response: requests.Response) -> Iterator[str]:
+    """Yield response fragments from Ollama's newline-delimited JSON stream.
 
-            return core_types.ScoredOutput(score=1.0, output=output_text)
-
-        except Exception as e:
-            raise lx_exceptions.InferenceRuntimeError(
-                f'Ollama OpenAI API error: {str(e)}', original=e
-            ) from e
+    Raises:
+        LLMClientError: If the server reports an error mid-stream
+    """
+    for line in response.iter_lines():
+        if not line:
+            continue
+        try:
+            event = loads_json(line)
+        except json.JSONDecodeError:
+            continue
+        if "error" in event:
+            raise LLMClientError(f"Ollama error: {event['error']}")
+        if event.get("response"):
+            yield event["response"]
+        if event.get("done"):
+            return
 
 
 @client("ollama")
@@ -114,7 +57,9 @@ class OllamaClient(BaseLLMClient):
         batch_length: int | None = None,
         max_char_buffer: int = 8000,
         show_progress: bool = True,
-        timeout: int = 120
+        timeout: int = 120,
+        cache_dir: str | Path | None = None,
+        cache_ttl: int | None = None,
     ) -> None:
         """Initialize Ollama client.
 
@@ -126,6 +71,8 @@ class OllamaClient(BaseLLMClient):
             max_char_buffer: Maximum characters for inference
             show_progress: Whether to show progress bar
             timeout: Request timeout in seconds
+            cache_dir: Directory for caching deterministic augment responses
+            cache_ttl: Lifetime of cached responses in seconds (None = forever)
         """
         _defaults = load_provider_defaults("ollama")
         self.model_id = model_id or _defaults["model_id"]
@@ -135,6 +82,53 @@ class OllamaClient(BaseLLMClient):
         self.max_char_buffer = max_char_buffer
         self.show_progress = show_progress
         self.timeout = timeout
+        self._cache = LLMCache(cache_dir, ttl_seconds=cache_ttl) if cache_dir else None
+        self._session = build_session(max(10, self.max_workers or 0))
+        self._lx_model: OllamaOpenAILanguageModel | None = None
+        self._lx_model_lock = threading.Lock()
+
+    def warmup(self) -> None:
+        """Load the model into Ollama's memory ahead of the first request.
+
+        A generate request without a prompt only loads the model.
+        """
+        try:
+            self._session.post(
+                f"{self.base_url}/api/generate",
+                json={"model": self.model_id},
+                timeout=self.timeout,
+            ).raise_for_status()
+        except requests.RequestException as e:
+            logger.debug("Ollama warmup failed: %s", e)
+
+    def close(self) -> None:
+        """Close the HTTP session and the response cache."""
+        self._session.close()
+        if self._cache is not None:
+            self._cache.close()
+
+    def _get_lx_model(self) -> OllamaOpenAILanguageModel:
+        """Return the langextract model, creating it on first use.
+
+        The model wraps an OpenAI SDK client with its own connection pool,
+        so one instance is shared by all extract() calls on this client.
+        """
+        with self._lx_model_lock:
+            if self._lx_model is None:
+                from .ollama_model import OllamaOpenAILanguageModel
+
+                # Ensure base_url ends with /v1 for the OpenAI provider
+                base_url = self.base_url
+                if not base_url.endswith('/v1') and not base_url.endswith('/v1/'):
+                    base_url = base_url.rstrip('/') + '/v1'
+
+                self._lx_model = OllamaOpenAILanguageModel(
+                    model_id=self.model_id,
+                    api_key="ollama", # Placeholder for OpenAI provider
+                    base_url=base_url,
+                    timeout=self.timeout
+                )
+            return self._lx_model
 
     def extract(
         self,
@@ -163,19 +157,10 @@ class OllamaClient(BaseLLMClient):
         Raises:
             LLMClientError: If extraction fails
         """
+        import langextract as lx
+
         try:
-            # Ensure base_url ends with /v1 for the OpenAI provider
-            base_url = self.base_url
-            if not base_url.endswith('/v1') and not base_url.endswith('/v1/'):
-                base_url = base_url.rstrip('/') + '/v1'
-
-            # Create Ollama OpenAI language model
-            ollama_model = OllamaOpenAILanguageModel(
-                model_id=self.model_id,
-                api_key="ollama", # Placeholder for OpenAI provider
-                base_url=base_url,
-                timeout=self.timeout
-            )
+            ollama_model = self._get_lx_model()
 
             # Prepare langextract kwargs
             langextract_kwargs = {
@@ -207,43 +192,11 @@ class OllamaClient(BaseLLMClient):
             )
 
             # Extract triples from result
-            triples = []
-            if hasattr(result, 'extractions') and result.extractions:
-                for extraction in result.extractions:
-                    # Robust attribute extraction (handles both wrapped and flat formats)
-                    attrs = extraction.attributes
-                    
-                    # If attributes is None, it might be a flat dict in extraction_text or data
-                    if attrs is None:
-                        # Some versions of langextract might put the dict in extraction_text if it's flat
-                        if isinstance(extraction.extraction_text, str):
-                            try:
-                                import json
-                                text_trimmed = extraction.extraction_text.strip()
-                                if text_trimmed.startswith('{') and text_trimmed.endswith('}'):
-                                    attrs = json.loads(text_trimmed)
-                            except:
-                                pass
-                    
-                    if attrs:
-                        # Ensure it's a dict
-                        triple = dict(attrs)
-                        
-                        # Add source grounding information from langextract
-                        if extraction.char_interval:
-                            triple["char_start"] = extraction.char_interval.start_pos
-                            triple["char_end"] = extraction.char_interval.end_pos
-                        else:
-                            triple["char_start"] = None
-                            triple["char_end"] = None
-                        
-                        # Add extraction metadata
-                        triple["extraction_text"] = str(extraction.extraction_text)
-                        triple["extraction_class"] = str(extraction.extraction_class)
-                        
-                        # Basic validation: must have head, relation, tail
-                        if all(k in triple for k in ('head', 'relation', 'tail')):
-                            triples.append(triple)
+            triples = [
+                triple
+                for extraction in getattr(result, "extractions", None) or ()
+                if (triple := grounded_triple(extraction)) is not None
+            ]
 
             return triples
 
@@ -274,73 +227,70 @@ class OllamaClient(BaseLLMClient):
         Returns:
             List of dictionaries matching the requested schema
         """
-        import json
-        import requests
+        cache_key = None
+        if self._cache is not None and not temperature:
+            cache_key = LLMCache.make_key(
+                method="augment",
+                client="ollama",
+                model=self.model_id,
+                text=text,
+                system=augment_preamble(prompt_description, format_type, indent=2),
+                max_tokens=max_tokens,
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         try:
-            # Build the prompt with schema
-            schema_json = json.dumps(format_type.model_json_schema(), indent=2)
-            full_prompt = f"""{prompt_description}
-
-Return the results as a JSON array of objects matching this schema:
-{schema_json}
-
-Input Text:
+            # Static instructions + schema go in the system prompt; only the
+            # input text varies per record
+            system_prompt = augment_preamble(prompt_description, format_type, indent=2)
+            user_prompt = f"""Input Text:
 {text}
 
 IMPORTANT: Respond with ONLY a valid JSON array. No markdown code blocks, no explanation, just the JSON array starting with [ and ending with ].
 Each object MUST have at minimum: "head", "relation", "tail" fields."""
 
             # Debug: Show prompt length
-            print(f"  [DEBUG Ollama] Prompt length: {len(full_prompt)} chars")
+            logger.debug("Ollama prompt length: %d chars", len(system_prompt) + len(user_prompt))
 
             # Call Ollama API directly
             # NOTE: Do NOT use format:"json" - it forces single object responses
-            # We want arrays like LMStudio, so rely on prompt instructions instead
-            response = requests.post(
+            # We want arrays like LMStudio, so rely on prompt instructions instead.
+            # The reply is streamed and reading stops at the first complete
+            # JSON array, closing the connection on anything generated after it.
+            with self._session.post(
                 f"{self.base_url}/api/generate",
                 json={
                     "model": self.model_id,
-                    "prompt": full_prompt,
-                    "stream": False,
+                    "system": system_prompt,
+                    "prompt": user_prompt,
+                    "stream": True,
                     # "format": "json",  # DISABLED - forces single object, not array
                     "options": {
                         "temperature": temperature if temperature is not None else 0.0,
                         **({"num_predict": max_tokens} if max_tokens else {}),
                     }
                 },
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-
-            result = response.json()
-            response_text = result.get("response", "")
+                timeout=self.timeout,
+                stream=True,
+            ) as response:
+                response.raise_for_status()
+                response_text, data = collect_until_json(_iter_stream_content(response))
 
             # Debug: Show raw response
-            print(f"  [DEBUG Ollama] Response length: {len(response_text)} chars")
-            print(f"  [DEBUG Ollama] Response preview: {response_text[:500]}...")
+            logger.debug("Ollama response length: %d chars", len(response_text))
+            logger.debug("Ollama response preview: %.500s...", response_text)
 
             if not response_text:
-                print("  [DEBUG Ollama] Empty response!")
+                logger.debug("Ollama returned an empty response")
                 return []
 
-            # Parse the JSON response with robust extraction
-            response_text = response_text.strip()
-            
-            # Remove markdown code blocks if present
-            import re
-            if response_text.startswith("```"):
-                match = re.search(r"```(?:json)?\s*([\s\S]*?)```", response_text)
-                if match:
-                    response_text = match.group(1).strip()
-            
-            # Find JSON array or object 
-            json_match = re.search(r'(\[[\s\S]*\]|\{[\s\S]*\})', response_text)
-            if json_match:
-                response_text = json_match.group(1)
-            
+            # Parse the JSON response with robust extraction, unless the
+            # stream already did
             try:
-                data = json.loads(response_text)
+                if data is None:
+                    data = parse_json_text(response_text)
                 if isinstance(data, list):
                     items = data
                 elif isinstance(data, dict):
@@ -356,18 +306,20 @@ Each object MUST have at minimum: "head", "relation", "tail" fields."""
                     return []
 
                 # Debug: Show parsed items
-                print(f"  [DEBUG Ollama] Parsed {len(items)} items")
+                logger.debug("Ollama parsed %d items", len(items))
                 for i, item in enumerate(items[:3]):  # Show first 3
-                    print(f"    Item {i}: {item}")
+                    logger.debug("  Item %d: %s", i, item)
 
                 # Force inference to contextual for bridging (consistency across providers)
                 for item in items:
                     if isinstance(item, dict):
                         item['inference'] = 'contextual'
-                
+
+                if cache_key is not None and items:
+                    self._cache.set(cache_key, items)
                 return items
             except json.JSONDecodeError as e:
-                print(f"  [DEBUG Ollama] JSON parse error: {e}")
+                logger.debug("Ollama JSON parse error: %s", e)
                 raise LLMClientError(f"Failed to parse JSON response: {e}\nResponse text: {response_text[:500]}")
 
         except requests.RequestException as e:
@@ -386,6 +338,8 @@ Each object MUST have at minimum: "head", "relation", "tail" fields."""
             max_char_buffer=config.max_char_buffer,
             show_progress=config.show_progress,
             timeout=config.timeout,
+            cache_dir=config.cache_dir,
+            cache_ttl=config.cache_ttl,
         )
 
 
@@ -0,0 +1,103 @@
+"""langextract model for Ollama's OpenAI-compatible endpoint.
+
+Kept apart from the client so that langextract (and the OpenAI SDK it pulls
+in) is only imported when extraction actually runs; augmentation bypasses it.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from langextract.providers.openai import OpenAILanguageModel
+from langextract.core import types as core_types
+from langextract.core import exceptions as lx_exceptions
+
+# Control-character cleanup pattern, compiled once for all requests
+_CONTROL_CHARS_PATTERN = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+class OllamaOpenAILanguageModel(OpenAILanguageModel):
+    """Custom OpenAI model for Ollama that removes unsupported response_format."""
+
+    def __init__(self, **kwargs):
+        # Extract timeout before super().__init__ discards it via **kwargs
+        self._request_timeout = kwargs.pop("timeout", 600)
+        super().__init__(**kwargs)
+        # Recreate OpenAI client with proper timeout for slow local models
+        import openai
+        self._client = openai.OpenAI(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            organization=self.organization,
+            timeout=self._request_timeout,
+        )
+        
+    @property
+    def requires_fence_output(self) -> bool:
+        """Ollama/LM Studio output needs fences when not using structured mode."""
+        return True
+
+    @staticmethod
+    def _sanitize_control_chars(text: str) -> str:
+        """Remove invalid JSON control characters from LLM output.
+
+        Some local models emit raw control characters (tabs, newlines, etc.)
+        inside JSON string values, which causes json.loads() to fail with
+        'Invalid control character'.  We replace them with spaces.
+        """
+        # Replace control chars (U+0000–U+001F) except \n \r \t which are
+        # commonly present in fenced output and handled by langextract.
+        # Inside JSON *strings* these are illegal, but we can't easily
+        # distinguish string-interior vs structural whitespace here, so we
+        # only strip the truly unusual ones (NUL, BEL, BS, VT, FF, etc.).
+        return _CONTROL_CHARS_PATTERN.sub(' ', text)
+
+    def _process_single_prompt(self, prompt: str, config: dict[str, Any]) -> core_types.ScoredOutput:
+        """Override to remove response_format and add logging."""
+        try:
+            # Get model configuration
+            model_config = self.merge_kwargs(config)
+
+            # Explicitly remove response_format as it can cause issues in Ollama/LM Studio
+            model_config.pop('response_format', None)
+
+            # Standard system message for JSON
+            system_message = (
+                "You are a helpful assistant that extracts information into structured JSON. "
+                "Follow the provided format Exactly, matching the field names and structure of the examples. "
+                "You may use ```json code fences. Do not include any preamble or extra explanations."
+            )
+
+            messages = [{'role': 'user', 'content': prompt}]
+            messages.insert(0, {'role': 'system', 'content': system_message})
+
+            api_params = {
+                'model': self.model_id,
+                'messages': messages,
+                'n': 1,
+            }
+
+            temp = model_config.get('temperature', self.temperature)
+            if temp is not None:
+                api_params['temperature'] = temp
+
+            if (v := model_config.get('max_output_tokens')) is not None:
+                api_params['max_tokens'] = v
+
+            response = self._client.chat.completions.create(**api_params)
+            output_text = response.choices[0].message.content
+
+            # Sanitize control characters that break JSON parsing
+            if output_text:
+                output_text = self._sanitize_control_chars(output_text)
+
+            return core_types.ScoredOutput(score=1.0, output=output_text)
+
+        except Exception as e:
+            raise lx_exceptions.InferenceRuntimeError(
+                f'Ollama OpenAI API error: {str(e)}', original=e
+            ) from e
+
+
+__all__ = ["OllamaOpenAILanguageModel"]
@@ -15,6 +15,8 @@ import json
 from pathlib import Path
 from typing import Any, Iterator
 
+from ...clients.parsing import loads_json
+
 
 class DataLoadError(Exception):
     """Raised when data loading fails."""
@@ -76,6 +78,8 @@ def load_records(
 
     format_type = detect_format(path)
 
+    # JSONL and CSV are streamed, so rows are parsed once and reading stops
+    # as soon as ``limit`` records have been collected
     if format_type == 'jsonl':
         records = _load_jsonl(path)
     elif format_type == 'json':
@@ -83,63 +87,68 @@ def load_records(
     else:  # csv
         records = _load_csv(path)
 
+    # Set membership keeps the filter O(1) per record however many ids are requested
+    wanted_ids = {str(rid) for rid in record_ids} if record_ids else None
+
     # Normalize field names and validate
     normalized = []
     for i, record in enumerate(records):
-        if record_ids and str(record[id_field]) not in record_ids:
-            continue
         if limit and len(normalized) >= limit:
             break
 
-        if text_field not in record:
+        # Index directly and only pay for the error path on malformed records
+        try:
+            record_id = record[id_field]
+        except (KeyError, TypeError):
             raise DataLoadError(
-                f"Missing text field '{text_field}' in record {i}",
+                f"Missing id field '{id_field}' in record {i}",
                 path,
                 line_number=i + 1
-            )
-        if id_field not in record:
+            ) from None
+        if wanted_ids is not None and str(record_id) not in wanted_ids:
+            continue
+        try:
+            text = record[text_field]
+        except (KeyError, TypeError):
             raise DataLoadError(
-                f"Missing id field '{id_field}' in record {i}",
+                f"Missing text field '{text_field}' in record {i}",
                 path,
                 line_number=i + 1
-            )
+            ) from None
 
-        # Normalize to standard field names
-        normalized_record = dict(record)
+        # Normalize to standard field names. Records are freshly parsed and
+        # owned by this function, so they are updated in place, not copied
         if text_field != "text":
-            normalized_record["text"] = record[text_field]
+            record["text"] = text
         if id_field != "id":
-            normalized_record["id"] = record[id_field]
+            record["id"] = record_id
 
-        normalized.append(normalized_record)
+        normalized.append(record)
 
     return normalized
 
 
-def _load_jsonl(path: Path) -> list[dict[str, Any]]:
-    """Load records from JSONL file (one JSON object per line)."""
-    records = []
-    with open(path, 'r', encoding='utf-8') as f:
+def _load_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    """Stream records from JSONL file (one JSON object per line)."""
+    with open(path, 'r', encoding='utf-8', buffering=1 << 20) as f:
         for line_num, line in enumerate(f, 1):
             line = line.strip()
             if not line:
                 continue
             try:
-                records.append(json.loads(line))
+                yield loads_json(line)
             except json.JSONDecodeError as e:
                 raise DataLoadError(
                     f"Invalid JSON on line {line_num}: {e}",
                     path,
                     line_number=line_num
                 ) from e
-    return records
 
 
 def _load_json(path: Path) -> list[dict[str, Any]]:
     """Load records from JSON file (array of objects)."""
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = loads_json(path.read_bytes())
     except json.JSONDecodeError as e:
         raise DataLoadError(f"Invalid JSON: {e}", path) from e
 
@@ -149,14 +158,22 @@ def _load_json(path: Path) -> list[dict[str, Any]]:
     return data
 
 
-def _load_csv(path: Path) -> list[dict[str, Any]]:
-    """Load records from CSV file."""
-    records = []
-    with open(path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
+def _load_csv(path: Path) -> Iterator[dict[str, Any]]:
+    """Stream records from CSV file.
+
+    Uses ``csv.reader`` and zips each row with the header, which avoids the
+    per-row bookkeeping of ``DictReader``. Blank lines are skipped; cells
+    missing from short rows are left out, so a short row surfaces as a
+    missing-field error in ``load_records``.
+    """
+    with open(path, 'r', encoding='utf-8-sig', newline='', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
         for row in reader:
-            records.append(dict(row))
-    return records
+            if row:
+                yield dict(zip(header, row))
 
 
 __all__ = ["load_records", "detect_format", "DataLoadError"]
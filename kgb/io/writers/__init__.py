@@ -1,8 +1,9 @@
 """Graph format converters.
 
-Converts extracted triples (JSON) to graph formats like GraphML.
+Saves extracted triples as JSON and converts them to graph formats like GraphML.
 """
 
 from .graphml import json_to_graphml, convert_json_directory
+from .triples import save_triples_json
 
-__all__ = ["json_to_graphml", "convert_json_directory"]
+__all__ = ["json_to_graphml", "convert_json_directory", "save_triples_json"]
@@ -8,11 +8,15 @@ from __future__ import annotations
 
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
 import networkx as nx
 
+from ...clients.parsing import loads_json
+
 
 def normalize_entity_name(name: str) -> str:
     """Normalize entity name by stripping whitespace.
@@ -73,54 +77,80 @@ def json_to_graphml(
     G = nx.DiGraph()
     entity_map: dict[str, str] = {}
 
-    # Ensure we have Triple objects
-    validated_triples: list[Triple] = []
     for t in triples:
-        if isinstance(t, Triple):
-            validated_triples.append(t)
-        else:
+        # Ensure we have a Triple object
+        if not isinstance(t, Triple):
             try:
-                validated_triples.append(Triple(**t))
+                t = Triple(**t)
             except Exception:
                 continue
 
-    for t in validated_triples:
         head = get_canonical_name(t.head, entity_map)
         tail = get_canonical_name(t.tail, entity_map)
 
         if not head or not tail:
             continue
 
-        # Add nodes
-        if head not in G.nodes():
-            G.add_node(head)
-        if tail not in G.nodes():
-            G.add_node(tail)
-
-        # Build edge attributes
-        edge_attrs = {
-            "relation": t.relation,
-            "inference": t.inference.value
-        }
-
-        G.add_edge(head, tail, **edge_attrs)
+        # add_edge creates missing nodes itself (head before tail)
+        G.add_edge(head, tail, relation=t.relation, inference=t.inference.value)
 
     # Save if path provided
     if output_path:
-        nx.write_graphml(G, str(output_path))
+        # A large buffer turns the serializer's many small writes into a few syscalls
+        with open(output_path, "wb", buffering=1 << 20) as f:
+            nx.write_graphml(G, f)
 
     return G
 
 
+def _list_json_files(input_dir: Path) -> list[Path]:
+    """List ``*.json`` files in a directory, sorted by name.
+
+    Uses ``os.scandir`` so file-type checks come from the directory entries
+    themselves instead of a ``stat()`` per path, which matters for output
+    directories with many thousands of records.
+    """
+    with os.scandir(input_dir) as entries:
+        return sorted(
+            (Path(entry.path) for entry in entries
+             if entry.name.endswith(".json") and entry.is_file()),
+            key=lambda path: path.name,
+        )
+
+
+def _convert_json_file(json_file: Path, output_dir: Path) -> Path | None:
+    """Convert one JSON triples file to GraphML; returns None if skipped."""
+    try:
+        data = loads_json(json_file.read_bytes())
+    except json.JSONDecodeError:
+        print(f"Skipping {json_file}: Invalid JSON")
+        return None
+
+    if not isinstance(data, list):
+        print(f"Skipping {json_file}: Not a list of triples")
+        return None
+
+    output_path = output_dir / f"{json_file.stem}.graphml"
+    G = json_to_graphml(data, output_path)
+
+    print(f"Converted {json_file.name}: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
+    return output_path
+
+
 def convert_json_directory(
     input_dir: Path | str,
-    output_dir: Path | str
+    output_dir: Path | str,
+    max_workers: int = 1,
 ) -> list[Path]:
     """Convert all JSON files in a directory to GraphML format.
 
+    Triple validation and GraphML serialization are CPU-bound, so with
+    ``max_workers > 1`` files are converted in a process pool.
+
     Args:
         input_dir: Directory containing JSON files
         output_dir: Directory to save GraphML files
+        max_workers: Number of worker processes (1 = convert in-process)
 
     Returns:
         List of paths to created GraphML files
@@ -129,27 +159,20 @@ def convert_json_directory(
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    graphml_files = []
-
-    for json_file in input_dir.glob("*.json"):
-        with open(json_file, "r", encoding="utf-8") as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError:
-                print(f"Skipping {json_file}: Invalid JSON")
-                continue
-
-        if not isinstance(data, list):
-            print(f"Skipping {json_file}: Not a list of triples")
-            continue
-
-        output_path = output_dir / f"{json_file.stem}.graphml"
-        G = json_to_graphml(data, output_path)
+    json_files = _list_json_files(input_dir)
 
-        print(f"Converted {json_file.name}: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
-        graphml_files.append(output_path)
+    if max_workers > 1 and len(json_files) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                _convert_json_file,
+                json_files,
+                repeat(output_dir),
+                chunksize=max(1, len(json_files) // (max_workers * 4)),
+            ))
+    else:
+        results = [_convert_json_file(json_file, output_dir) for json_file in json_files]
 
-    return graphml_files
+    return [path for path in results if path is not None]
 
 
 __all__ = ["json_to_graphml", "convert_json_directory", "normalize_entity_name", "get_canonical_name"]
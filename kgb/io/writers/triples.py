@@ -0,0 +1,38 @@
+"""Write extracted triples to JSON files."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+from ...clients.parsing import dumps_json
+
+if TYPE_CHECKING:
+    from ...domains import Triple
+
+
+def save_triples_json(triples: Iterable[Triple], output_path: Path) -> bool:
+    """Save triples as an indented JSON array.
+
+    The document is serialized in memory (with orjson when installed) and
+    written with a single call; ``json.dump`` would instead issue one small
+    write per token. If the file already holds exactly this content (a
+    deterministic re-run), it is left untouched, so its mtime stays valid
+    for downstream steps.
+
+    Args:
+        triples: Triples to save
+        output_path: Destination JSON file
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    data = dumps_json([t.model_dump() for t in triples], indent=2).encode("utf-8")
+    try:
+        # Size check first, so changed files are usually not read at all
+        if output_path.stat().st_size == len(data) and output_path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    output_path.write_bytes(data)
+    return True
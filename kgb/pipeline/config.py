@@ -75,7 +75,7 @@ def build_pipeline_from_config(
     Supported override keys mirror the YAML top-level keys:
     ``input_file``, ``output_dir``, ``domain``, ``mode``, ``client``, ``model``,
     ``api_key``, ``base_url``, ``temperature``, ``timeout``, ``workers``,
-    ``text_field``, ``id_field``, ``limit``, ``no_progress``.
+    ``cache_dir``, ``text_field``, ``id_field``, ``limit``, ``no_progress``.
 
     Args:
         raw_config: The dict returned by :func:`load_pipeline_config`.
@@ -107,6 +107,7 @@ def build_pipeline_from_config(
     max_workers = _resolve(client_section, "workers", "workers")
     if max_workers is not None:
         max_workers = int(max_workers)
+    cache_dir = _resolve(client_section, "cache_dir", "cache_dir")
     no_progress = _resolve(None, "", "no_progress", False)
 
     config_kwargs: dict[str, Any] = {
@@ -123,9 +124,12 @@ def build_pipeline_from_config(
         config_kwargs["base_url"] = base_url
     if max_workers:
         config_kwargs["max_workers"] = max_workers
+    if cache_dir:
+        config_kwargs["cache_dir"] = str(cache_dir)
 
     client_config = ClientConfig(**config_kwargs)
     llm_client = ClientFactory.create(client_config)
+    llm_client.warmup()
 
     # -- Domain ----------------------------------------------------------------
     domain_name = _resolve(raw_config, "domain", "domain", "default")
@@ -178,6 +182,8 @@ def build_pipeline_from_config(
             kwargs.setdefault("client", llm_client)
             kwargs.setdefault("domain", domain_obj)
             kwargs.setdefault("temperature", temperature)
+        if step_name == "extract" and cache_dir:
+            kwargs.setdefault("cache_dir", str(cache_dir))
 
         if step_name in _STEP_OUTPUT_SUBDIRS:
             subdir = _STEP_OUTPUT_SUBDIRS[step_name]
@@ -87,4 +87,17 @@ class PipelineRunner:
             
         return results
 
+    def close(self) -> None:
+        """Release resources held by the steps and the clients they share."""
+        clients = {}
+        for step in self.steps:
+            close = getattr(step, "close", None)
+            if close is not None:
+                close()
+            client = getattr(step, "client", None)
+            if client is not None:
+                clients[id(client)] = client
+        for client in clients.values():
+            client.close()
+
 __all__ = ["PipelineRunner"]
@@ -24,7 +24,8 @@ class AugmentationStep:
         max_disconnected: int = 3,
         max_iterations: int = 2,
         temperature: float = 0.0,
-        augmentation_prompt_override: str | None = None
+        augmentation_prompt_override: str | None = None,
+        local_bridging: bool = False,
     ):
         """Initialize the augmentation step.
         
@@ -36,6 +37,7 @@ class AugmentationStep:
             max_iterations: Max retry attempts parameter.
             temperature: LLM temperature setting.
             augmentation_prompt_override: Optional custom prompt text.
+            local_bridging: Link near-duplicate entities before calling the LLM.
         """
         self.client = client
         self.domain = domain
@@ -44,6 +46,7 @@ class AugmentationStep:
         self.max_iterations = max_iterations
         self.temperature = temperature
         self.augmentation_prompt_override = augmentation_prompt_override
+        self.local_bridging = local_bridging
 
     def process(self, context: PipelineContext, **kwargs: Any) -> PipelineContext:
         """Execute augmentation to connect graph components via inference.
@@ -70,7 +73,8 @@ class AugmentationStep:
                 max_disconnected=self.max_disconnected,
                 max_iterations=self.max_iterations,
                 augmentation_strategy=self.strategy,
-                augmentation_prompt_override=self.augmentation_prompt_override
+                augmentation_prompt_override=self.augmentation_prompt_override,
+                local_bridging=self.local_bridging,
             )
             # Override former triples state with augmented ones
             context.triples = triples
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
+from ...io.writers import save_triples_json
 from ..context import PipelineContext
 from ..step import register_step
 
@@ -36,8 +36,7 @@ class ExportJSONStep:
             self.output_dir.mkdir(parents=True, exist_ok=True)
             output_path = self.output_dir / f"{context.record_id}.json"
             
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump([t.model_dump() for t in context.triples], f, ensure_ascii=False, indent=2)
+            save_triples_json(context.triples, output_path)
                 
             # Log output artifacts mapping
             context.artifacts["export_json_path"] = str(output_path)
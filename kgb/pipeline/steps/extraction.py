@@ -6,8 +6,8 @@ import json
 from typing import Any
 from pathlib import Path
 
-from ...builder import extract_triples
-from ...clients import BaseLLMClient
+from ...builder import extract_triples, prepare_extraction
+from ...clients import BaseLLMClient, LLMCache
 from ...domains import KnowledgeDomain
 
 from ..context import PipelineContext
@@ -23,7 +23,8 @@ class ExtractionStep:
         client: BaseLLMClient, 
         domain: KnowledgeDomain, 
         temperature: float = 0.0,
-        prompt_override: str | None = None
+        prompt_override: str | None = None,
+        cache_dir: str | None = None,
     ):
         """Initialize the extraction step.
         
@@ -32,11 +33,15 @@ class ExtractionStep:
             domain: Knowledge domain defining the context and extraction prompt.
             temperature: Sampling temperature for inference.
             prompt_override: Optional override for the prompt text.
+            cache_dir: Optional directory for caching deterministic LLM responses.
         """
         self.client = client
         self.domain = domain
         self.temperature = temperature
         self.prompt_override = prompt_override
+        # Schema constraints and prompt guidance are the same for every record.
+        self._plan = prepare_extraction(domain, prompt_override)
+        self._cache = LLMCache(cache_dir) if cache_dir else None
 
     def process(self, context: PipelineContext, **kwargs: Any) -> PipelineContext:
         """Execute text extraction and update context triples.
@@ -55,7 +60,8 @@ class ExtractionStep:
                 text=context.text,
                 record_id=context.record_id,
                 temperature=self.temperature,
-                prompt_override=self.prompt_override
+                plan=self._plan,
+                cache=self._cache,
             )
             context.triples.extend(triples)
         except Exception as e:
@@ -63,4 +69,9 @@ class ExtractionStep:
             
         return context
 
+    def close(self) -> None:
+        """Close the response cache owned by this step."""
+        if self._cache is not None:
+            self._cache.close()
+
 __all__ = ["ExtractionStep"]
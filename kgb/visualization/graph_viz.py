@@ -9,7 +9,10 @@ from __future__ import annotations
 
 import json
 import math
+import os
 import webbrowser
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
@@ -1428,19 +1431,41 @@ def render_graph(
     return None
 
 
+def _render_graph_file(
+    graphml_file: Path,
+    output_dir: Path,
+    dark_mode: bool,
+    layout: str,
+) -> Path | None:
+    """Render one GraphML file to HTML; returns None if it failed."""
+    output_path = output_dir / f"{graphml_file.stem}.html"
+    try:
+        render_graph(graphml_file, output_path, dark_mode=dark_mode, layout=layout)
+    except Exception as e:
+        print(f"  Error with {graphml_file.name}: {e}")
+        return None
+    print(f"  Created: {output_path.name}")
+    return output_path
+
+
 def batch_render_graphs(
     input_dir: Path | str,
     output_dir: Path | str | None = None,
     dark_mode: bool = False,
-    layout: str = "spring"
+    layout: str = "spring",
+    max_workers: int = 1,
 ) -> list[Path]:
     """Render all GraphML files in a directory.
 
+    Layout and community detection are CPU-bound, so with
+    ``max_workers > 1`` graphs are rendered in a process pool.
+
     Args:
         input_dir: Directory containing .graphml files
         output_dir: Output directory for HTML files
         dark_mode: Whether to use dark mode
         layout: Layout algorithm
+        max_workers: Number of worker processes (1 = render in-process)
 
     Returns:
         List of paths to created HTML files
@@ -1449,7 +1474,12 @@ def batch_render_graphs(
     output_dir = Path(output_dir) if output_dir else input_dir / "visualizations"
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    graphml_files = list(input_dir.glob("*.graphml"))
+    # scandir entries carry their file type, so no per-path stat() is needed
+    with os.scandir(input_dir) as entries:
+        graphml_files = [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(".graphml") and entry.is_file()
+        ]
 
     if not graphml_files:
         print(f"No .graphml files found in {input_dir}")
@@ -1457,17 +1487,22 @@ def batch_render_graphs(
 
     print(f"Visualizing {len(graphml_files)} graphs...")
 
-    html_files = []
-    for graphml_file in graphml_files:
-        output_path = output_dir / f"{graphml_file.stem}.html"
-        try:
-            render_graph(graphml_file, output_path, dark_mode=dark_mode, layout=layout)
-            html_files.append(output_path)
-            print(f"  Created: {output_path.name}")
-        except Exception as e:
-            print(f"  Error with {graphml_file.name}: {e}")
-
-    return html_files
+    if max_workers > 1 and len(graphml_files) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                _render_graph_file,
+                graphml_files,
+                repeat(output_dir),
+                repeat(dark_mode),
+                repeat(layout),
+            ))
+    else:
+        results = [
+            _render_graph_file(graphml_file, output_dir, dark_mode, layout)
+            for graphml_file in graphml_files
+        ]
+
+    return [path for path in results if path is not None]
 
 
 __all__ = [
@@ -3,14 +3,13 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
-
-import langextract as lx
-from langextract import data
-
+from typing import TYPE_CHECKING, Any
 
 from ..domains import Triple, InferenceType
 
+if TYPE_CHECKING:
+    from langextract import data
+
 
 class TextVisualizer:
     """Create interactive HTML visualizations of extracted triples in source text.
@@ -48,6 +47,8 @@ class TextVisualizer:
         inference: InferenceType | str | None = None
     ) -> data.Extraction | None:
         """Create an Extraction object for an entity."""
+        from langextract import data
+
         # Find the entity in the text (case-sensitive)
         start_pos = text.find(entity_text)
 
@@ -174,6 +175,10 @@ class TextVisualizer:
         if not extractions:
             return "<p>No entities found in the text</p>"
 
+        # Imported here so loading the CLI does not pay for langextract
+        import langextract as lx
+        from langextract import data
+
         annotated_doc = data.AnnotatedDocument(
             text=text,
             extractions=extractions,
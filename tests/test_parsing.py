@@ -0,0 +1,44 @@
+"""Tests for streamed JSON collection in kgb.clients.parsing."""
+
+from kgb.clients.parsing import collect_until_json, parse_json_text
+
+
+def _chunks(text: str, size: int = 3) -> list[str]:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_prose_with_json_brackets_is_read_to_the_end():
+    response = 'Here are [3] triples:\n[{"head": "A", "relation": "r", "tail": "B"}]'
+
+    collected, value = collect_until_json(_chunks(response))
+
+    assert collected == response
+    assert value is None
+    assert parse_json_text(collected) == [
+        {"head": "A", "relation": "r", "tail": "B"}
+    ]
+
+
+def test_wrapper_object_is_not_cut_at_its_first_list():
+    payload = '{"entities": ["A", "B"], "triples": [{"head": "A", "relation": "r", "tail": "B"}]}'
+    response = payload + "\nLet me know if you need more [details]."
+
+    collected, value = collect_until_json(_chunks(response))
+
+    assert collected.startswith(payload)
+    assert "details" not in collected
+    assert value == {
+        "entities": ["A", "B"],
+        "triples": [{"head": "A", "relation": "r", "tail": "B"}],
+    }
+
+
+def test_leading_array_stops_the_stream_early():
+    payload = '[{"head": "A", "relation": "r", "tail": "B", "note": "]"}]'
+    chunks = _chunks(payload + " and some trailing notes")
+
+    collected, value = collect_until_json(chunks)
+
+    assert collected.startswith(payload)
+    assert "trailing" not in collected
+    assert value == [{"head": "A", "relation": "r", "tail": "B", "note": "]"}]